@@ -10,13 +10,11 @@ Attributes:
     structure and content of a valid JSON configuration file.
 """
 
-from __future__ import unicode_literals
-
 import os
+import types
 
 import ujson
 import validictory
-import attrdict
 
 from mp_ingester import excs
 
@@ -81,7 +79,7 @@ def load_config_file(fname_config_file):
         raise excs.ConfigFileNotFound(msg_fmt)
 
     # Read the JSON file.
-    with open(fname_config_file, str("r")) as finp:
+    with open(fname_config_file, "r") as finp:
         config = ujson.load(finp)
 
     return config
@@ -122,20 +120,43 @@ def validate_config(config_instance, config_schema=None):
     return True
 
 
+def to_namespace(value):
+    """ Recursively converts a `dict` into a `types.SimpleNamespace` so that
+        its items can be accessed as attributes.
+
+    Args:
+        value: The value to convert. Dictionaries are converted into
+            namespaces, lists are converted item-by-item, and any other values
+            are returned as-is.
+
+    Returns:
+        The converted value.
+    """
+
+    if isinstance(value, dict):
+        return types.SimpleNamespace(
+            **{key: to_namespace(item) for key, item in value.items()}
+        )
+    elif isinstance(value, list):
+        return [to_namespace(item) for item in value]
+
+    return value
+
+
 def import_config(fname_config_file):
     """ Loads and validates a JSON configuration file.
 
     This method uses the `load_config_file` and `validate_config` functions to
     load a JSON configuration file and validate against the
-    `config_schema_default` returning the validates configuration as an
-    `attrdict.AttrDict`.
+    `config_schema_default` returning the validates configuration as a
+    `types.SimpleNamespace`.
 
     Args:
         fname_config_file (str, unicode): The path to the JSON configuration
             file.
 
     Returns:
-        attrdict.AttrDict: The imported configuration `AttrDict`.
+        types.SimpleNamespace: The imported configuration namespace.
     """
 
     # Load the JSON configuration file.
@@ -145,4 +166,4 @@ def import_config(fname_config_file):
     # schema.
     validate_config(config_instance=config, config_schema=config_schema_default)
 
-    return attrdict.AttrDict(config)
+    return to_namespace(config)
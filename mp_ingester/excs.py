@@ -11,14 +11,14 @@ class ConfigFileNotFound(Exception):
     """ Exception raised when a JSON configuration file is missing."""
 
     def __init__(self, message, *args):
-        super(ConfigFileNotFound, self).__init__(message, *args)
+        super().__init__(message, *args)
 
 
 class ConfigFileInvalid(Exception):
     """ Exception raised when a JSON configuration file is invalid."""
 
     def __init__(self, message, *args):
-        super(ConfigFileInvalid, self).__init__(message, *args)
+        super().__init__(message, *args)
 
 
 class MedlinePlusHttpRequestGetError(Exception):
@@ -27,4 +27,4 @@ class MedlinePlusHttpRequestGetError(Exception):
     """
 
     def __init__(self, message, *args):
-        super(MedlinePlusHttpRequestGetError, self).__init__(message, *args)
+        super().__init__(message, *args)
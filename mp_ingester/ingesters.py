@@ -1,13 +1,29 @@
 # -*- coding: utf-8 -*-
 
 import abc
-from typing import Union, List, Dict, Optional
-
+import collections
+import contextlib
+import io
+from typing import Union, List, Dict, Optional, Any, Type, Iterable, Tuple
+from typing import Iterator
+
+import sqlalchemy
+import sqlalchemy.orm
+from sqlalchemy.dialects.postgresql import insert
 from fform.dals_mp import DalMedline
 from fform.orm_mp import HealthTopicGroupClass
 from fform.orm_mp import HealthTopicGroup
 from fform.orm_mp import HealthTopic
 from fform.orm_mp import BodyPart
+from fform.orm_mp import AlsoCalled
+from fform.orm_mp import SeeReference
+from fform.orm_mp import PrimaryInstitute
+from fform.orm_mp import HealthTopicAlsoCalled
+from fform.orm_mp import HealthTopicHealthTopicGroup
+from fform.orm_mp import HealthTopicDescriptor
+from fform.orm_mp import HealthTopicRelatedHealthTopic
+from fform.orm_mp import HealthTopicSeeReference
+from fform.orm_mp import HealthTopicBodyPart
 from fform.orm_mt import Descriptor
 
 from mp_ingester.loggers import create_logger
@@ -33,6 +49,374 @@ class IngesterDocumentBase(object):
             logger_level=kwargs.get("logger_level", "DEBUG"),
         )
 
+        # Cache of the primary-key IDs of previously retrieved records keyed on
+        # the ORM class and the attribute name and value they were retrieved
+        # by.
+        self._cache = {}  # type: Dict[Tuple[Type, str, Any], int]
+
+    @contextlib.contextmanager
+    def bulk_load(self) -> Iterator[sqlalchemy.orm.Session]:
+        """ Context manager yielding a session whose transaction is committed
+            asynchronously, i.e., without waiting for the WAL to be flushed to
+            disk, so that bulk-loads don't incur an `fsync` per commit.
+
+        The transaction is committed when the context is exited and rolled back
+        should an exception be raised in which case the cached primary-key IDs
+        are dropped as they may refer to records that were rolled back.
+
+        Yields:
+            sqlalchemy.orm.Session: The session to perform the bulk-load in.
+        """
+
+        try:
+            with self.dal.session_scope() as session:
+                session.execute(
+                    sqlalchemy.text("SET LOCAL synchronous_commit = OFF")
+                )
+                yield session
+        except Exception:
+            self._cache.clear()
+            raise
+
+    def _bulk_iodi(
+        self,
+        orm_class: Type,
+        rows: List[Dict[str, Any]],
+        index_elements: Optional[List[str]] = None,
+        session: Optional[sqlalchemy.orm.Session] = None,
+    ):
+        """ Inserts multiple records of a given ORM class in a single
+            `INSERT ... ON CONFLICT DO NOTHING` statement thus replicating the
+            semantics of the DAL `iodi_*` methods without a database round-trip
+            per record.
+
+        Args:
+            orm_class (Type): The ORM class of the records to insert.
+            rows (List[Dict[str, Any]]): The records to insert as dictionaries
+                keyed on the column names.
+            index_elements (Optional[List[str]]): The names of the columns
+                comprising the unique constraint that defines a conflict.
+                Defaults to `None` in which case any constraint violation is
+                considered a conflict.
+            session (Optional[sqlalchemy.orm.Session]): The session to execute
+                the statement in. Defaults to `None` in which case the statement
+                is executed and committed within its own `bulk_load` session.
+        """
+
+        if not rows:
+            return None
+
+        statement = insert(orm_class.__table__).values(rows)
+        statement = statement.on_conflict_do_nothing(
+            index_elements=index_elements
+        )
+
+        if session is not None:
+            session.execute(statement)
+            return None
+
+        with self.bulk_load() as session:
+            session.execute(statement)
+
+    @staticmethod
+    def _copy_value(value: Any) -> str:
+        """ Serializes a value in the `COPY` text format.
+
+        Args:
+            value (Any): The value to serialize.
+
+        Returns:
+            str: The serialized value with `None` written as `\\N` and
+                backslashes, tabs, and newlines escaped.
+        """
+
+        if value is None:
+            return "\\N"
+
+        return (
+            str(value)
+            .replace("\\", "\\\\")
+            .replace("\t", "\\t")
+            .replace("\n", "\\n")
+            .replace("\r", "\\r")
+        )
+
+    @classmethod
+    def _copy_via_temp_table(
+        cls,
+        table_tmp: str,
+        columns: List[str],
+        rows: Iterable[Iterable[Any]],
+        sql_select: str,
+        sql_insert: str,
+        session: sqlalchemy.orm.Session,
+    ):
+        """ Copies records into a temporary table through `COPY ... FROM STDIN`
+            and inserts them into the actual table with a single statement thus
+            bypassing the SQL parser for the bulk of the data.
+
+        Args:
+            table_tmp (str): The name of the temporary table.
+            columns (List[str]): The names of the columns the records are
+                copied into.
+            rows (Iterable[Iterable[Any]]): The records to copy as iterables of
+                values in the order of `columns`.
+            sql_select (str): The `SELECT` query defining the columns of the
+                temporary table.
+            sql_insert (str): The statement inserting the records from the
+                temporary table into the actual table. Any `{table_tmp}`
+                placeholder is replaced with the name of the temporary table.
+            session (sqlalchemy.orm.Session): The session to perform the insert
+                in.
+        """
+
+        copy_value = cls._copy_value
+
+        # Serialize the records in the `COPY` text format.
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write("\t".join(copy_value(value) for value in row))
+            buffer.write("\n")
+        buffer.seek(0)
+
+        session.execute(
+            sqlalchemy.text(
+                "CREATE TEMP TABLE {0} AS {1} WITH NO DATA".format(
+                    table_tmp, sql_select
+                )
+            )
+        )
+
+        # Copy the records into the temporary table through the underlying
+        # DBAPI (psycopg2) cursor.
+        with session.connection().connection.cursor() as cursor:
+            cursor.copy_expert(
+                "COPY {0} ({1}) FROM STDIN".format(
+                    table_tmp, ", ".join(columns)
+                ),
+                buffer,
+            )
+
+        session.execute(sqlalchemy.text(sql_insert.format(table_tmp=table_tmp)))
+        session.execute(sqlalchemy.text("DROP TABLE {0}".format(table_tmp)))
+
+    @classmethod
+    def _copy_iodi(
+        cls,
+        orm_class: Type,
+        rows: List[Dict[str, Any]],
+        session: sqlalchemy.orm.Session,
+    ):
+        """ Inserts multiple records of a given ORM class through
+            `COPY ... FROM STDIN` into a temporary table followed by an
+            `INSERT ... SELECT DISTINCT ... ON CONFLICT DO NOTHING` into the
+            actual table thus retaining the semantics of the DAL `iodi_*`
+            methods.
+
+        Args:
+            orm_class (Type): The ORM class of the records to insert.
+            rows (List[Dict[str, Any]]): The records to insert as dictionaries
+                keyed on the column names.
+            session (sqlalchemy.orm.Session): The session to perform the insert
+                in.
+        """
+
+        if not rows:
+            return None
+
+        table = orm_class.__table__
+        columns = list(rows[0].keys())
+        columns_joined = ", ".join(columns)
+
+        cls._copy_via_temp_table(
+            table_tmp="tmp_{0}".format(table.name),
+            columns=columns,
+            rows=(row.values() for row in rows),
+            sql_select="SELECT {0} FROM {1}".format(
+                columns_joined, table.fullname
+            ),
+            sql_insert=(
+                "INSERT INTO {0} ({1}) SELECT DISTINCT {1} FROM {{table_tmp}} "
+                "ON CONFLICT DO NOTHING".format(table.fullname, columns_joined)
+            ),
+            session=session,
+        )
+
+    def _bulk_iodu(
+        self,
+        orm_class: Type,
+        rows: List[Dict[str, Any]],
+        index_element: str,
+        session: Optional[sqlalchemy.orm.Session] = None,
+    ) -> Dict[Any, int]:
+        """ Inserts or updates multiple records of a given ORM class in a
+            single `INSERT ... ON CONFLICT DO UPDATE ... RETURNING` statement
+            thus replicating the semantics of the DAL `iodu_*` methods without
+            a database round-trip per record.
+
+        Args:
+            orm_class (Type): The ORM class of the records to upsert.
+            rows (List[Dict[str, Any]]): The records to upsert as dictionaries
+                keyed on the column names. Records sharing the same
+                `index_element` value are deduplicated with the last one
+                prevailing while records without one are skipped as they
+                can't be told apart.
+            index_element (str): The name of the uniquely constrained column
+                that defines a conflict.
+            session (Optional[sqlalchemy.orm.Session]): The session to execute
+                the statement in. Defaults to `None` in which case the statement
+                is executed and committed within its own `bulk_load` session.
+
+        Returns:
+            Dict[Any, int]: The primary-key IDs of the upserted records keyed on
+                their `index_element` values.
+        """
+
+        if session is None:
+            with self.bulk_load() as session:
+                return self._bulk_iodu(
+                    orm_class=orm_class,
+                    rows=rows,
+                    index_element=index_element,
+                    session=session,
+                )
+
+        # Deduplicate the records as a single statement cannot affect the same
+        # row twice.
+        rows = list(
+            {
+                row[index_element]: row
+                for row in rows
+                if row[index_element] is not None
+            }.values()
+        )
+
+        if not rows:
+            return {}
+
+        column_pk = sqlalchemy.inspect(orm_class).primary_key[0]
+        column_index = orm_class.__table__.c[index_element]
+
+        statement = insert(orm_class.__table__).values(rows)
+        statement = statement.on_conflict_do_update(
+            index_elements=[index_element],
+            set_={
+                name: statement.excluded[name]
+                for name in rows[0]
+                if name != index_element
+            },
+        ).returning(column_pk, column_index)
+
+        ids = {}
+        for obj_id, value in session.execute(statement).fetchall():
+            self._cache[(orm_class, index_element, value)] = obj_id
+            ids[value] = obj_id
+
+        return ids
+
+    def _bulk_iodi_names(
+        self,
+        orm_class: Type,
+        names: Iterable[Optional[str]],
+        session: Optional[sqlalchemy.orm.Session] = None,
+    ) -> Dict[str, int]:
+        """ Inserts the records of a given ORM class uniquely identified by
+            their `name` in a single statement and retrieves the primary-key
+            IDs of both the inserted and already existing records in a single
+            query.
+
+        Args:
+            orm_class (Type): The ORM class of the records to insert.
+            names (Iterable[Optional[str]]): The names of the records to insert.
+                Empty names are skipped.
+            session (Optional[sqlalchemy.orm.Session]): The session to execute
+                the statements in. Defaults to `None` in which case each
+                statement is executed within its own session.
+
+        Returns:
+            Dict[str, int]: The primary-key IDs of the records keyed on their
+                names.
+        """
+
+        names = {name for name in names if name}
+
+        self._bulk_iodi(
+            orm_class=orm_class,
+            rows=[{"name": name} for name in names],
+            index_elements=["name"],
+            session=session,
+        )
+
+        return self._get_ids_by_attr(
+            orm_class=orm_class,
+            attr_name="name",
+            attr_values=names,
+            session=session,
+        )
+
+    def _get_ids_by_attr(
+        self,
+        orm_class: Type,
+        attr_name: str,
+        attr_values: Iterable[Any],
+        session: Optional[sqlalchemy.orm.Session] = None,
+    ) -> Dict[Any, int]:
+        """ Retrieves the primary-key IDs of the records of a given ORM class
+            matching the distinct values of a given attribute.
+
+        Values that have been previously retrieved are served from the cache
+        while the remaining ones are retrieved with a single
+        `SELECT ... WHERE <attribute> IN (...)` query.
+
+        Args:
+            orm_class (Type): The ORM class of the records to retrieve.
+            attr_name (str): The name of the attribute to match on.
+            attr_values (Iterable[Any]): The attribute values to match.
+            session (Optional[sqlalchemy.orm.Session]): The session to execute
+                the query in. Defaults to `None` in which case the query is
+                executed within its own session.
+
+        Returns:
+            Dict[Any, int]: The primary-key IDs keyed on the attribute values.
+                Values without a matching record are omitted.
+        """
+
+        ids = {}
+        attr_values_missing = []
+        for attr_value in set(attr_values):
+            key = (orm_class, attr_name, attr_value)
+            if key in self._cache:
+                ids[attr_value] = self._cache[key]
+            else:
+                attr_values_missing.append(attr_value)
+
+        if not attr_values_missing:
+            return ids
+
+        if session is None:
+            with self.dal.session_scope() as session:
+                ids.update(
+                    self._get_ids_by_attr(
+                        orm_class=orm_class,
+                        attr_name=attr_name,
+                        attr_values=attr_values_missing,
+                        session=session,
+                    )
+                )
+            return ids
+
+        column_pk = sqlalchemy.inspect(orm_class).primary_key[0]
+        column_attr = getattr(orm_class, attr_name)
+
+        query = session.query(column_pk, column_attr).filter(
+            column_attr.in_(attr_values_missing)
+        )
+        for obj_id, attr_value in query.all():
+            self._cache[(orm_class, attr_name, attr_value)] = obj_id
+            ids[attr_value] = obj_id
+
+        return ids
+
     @abc.abstractmethod
     def ingest(self, document: Dict) -> int:
         raise NotImplementedError
@@ -56,7 +440,25 @@ class IngesterMedlineGroupClasses(IngesterDocumentBase):
         if not name:
             return None
 
-        self.dal.iodi_health_topic_group_class(name=name)
+        return self.ingest_many(names=[name])[name]
+
+    def ingest_many(self, names: List[str]) -> Dict[str, int]:
+        """ Ingests multiple health-topic group classes and creates the
+            `HealthTopicGroupClass` records in a single statement.
+
+        Args:
+            names (List[str]): The names of the health-topic group classes.
+
+        Returns:
+             Dict[str, int]: The primary-key IDs of the `HealthTopicGroupClass`
+                records keyed on their names.
+        """
+
+        self.logger.debug(f"Ingesting {len(names)} 'group-class' documents")
+
+        return self._bulk_iodi_names(
+            orm_class=HealthTopicGroupClass, names=names
+        )
 
 
 class IngesterMedlineBodyParts(IngesterDocumentBase):
@@ -78,19 +480,66 @@ class IngesterMedlineBodyParts(IngesterDocumentBase):
         if not name:
             return None
 
-        # Retrieve the PK ID of the related `HealthTopicGroup` record.
-        # noinspection PyTypeChecker
-        health_topic_group = self.dal.get_by_attr(
+        # Insert the `BodyPart` record resolving the PK ID of the related
+        # `HealthTopicGroup` record within the same statement.
+        statement = insert(BodyPart.__table__).from_select(
+            ["name", "health_topic_group_id"],
+            sqlalchemy.select(
+                [
+                    sqlalchemy.literal(name),
+                    HealthTopicGroup.health_topic_group_id,
+                ]
+            ).where(HealthTopicGroup.url == health_topic_group_url),
+        )
+        statement = statement.on_conflict_do_nothing()
+
+        with self.bulk_load() as session:
+            session.execute(statement)
+
+    def ingest_many(self, documents: TypeHealthTopicBodyParts) -> None:
+        """ Ingests multiple scraped body-parts and creates the
+            `HealthTopicBodyPart` records.
+
+        Args:
+            documents (TypeHealthTopicBodyParts): The scraped body-parts.
+        """
+
+        self.logger.debug(f"Ingesting {len(documents)} 'body-part' documents")
+
+        # Index the names of the body-parts by the URL of the health-topic
+        # group they belong to.
+        url_to_names = collections.defaultdict(list)
+        for document in documents:
+            if document["name"]:
+                url_to_names[document["group_url"]].append(document["name"])
+
+        # Retrieve the PK IDs of the `HealthTopicGroup` records for all URLs
+        # in a single query.
+        health_topic_group_ids = self._get_ids_by_attr(
             orm_class=HealthTopicGroup,
             attr_name="url",
-            attr_value=health_topic_group_url,
-        )  # type: HealthTopicGroup
-
-        self.dal.iodi_body_part(
-            name=name,
-            health_topic_group_id=health_topic_group.health_topic_group_id,
+            attr_values=list(url_to_names.keys()),
         )
 
+        rows = []
+        for url, names in url_to_names.items():
+            # Skip body-parts under health-topic groups that haven't been
+            # ingested.
+            health_topic_group_id = health_topic_group_ids.get(url)
+            if health_topic_group_id is None:
+                self.logger.warning(
+                    f"The health-topic group with URL '{url}' was not found. "
+                    f"Skipping body-parts {names}."
+                )
+                continue
+
+            rows.extend(
+                {"name": name, "health_topic_group_id": health_topic_group_id}
+                for name in names
+            )
+
+        self._bulk_iodi(orm_class=BodyPart, rows=rows)
+
 
 class IngesterMedlineGroups(IngesterDocumentBase):
     """ Ingester class meant to ingest parsed `MedlinePlus Health Topic Group
@@ -109,9 +558,17 @@ class IngesterMedlineGroups(IngesterDocumentBase):
             dal (DalMedline): The DAL to be used to interact with the database.
         """
 
-        super(IngesterMedlineGroups, self).__init__(dal=dal, kwargs=kwargs)
+        super().__init__(dal=dal, **kwargs)
 
-        self.health_topic_group_classes = health_topic_group_classes
+        # Index the names of the health-topic group classes by the names of the
+        # health-topic groups they encompass. Should a group appear under
+        # multiple classes the first one is kept.
+        self._group_to_class = {}  # type: Dict[str, str]
+        for entry in health_topic_group_classes:
+            for health_topic_group in entry["health_topic_groups"]:
+                self._group_to_class.setdefault(
+                    health_topic_group["name"], entry["name"]
+                )
 
     def _get_group_class(self, health_topic_group_name: str) -> Optional[str]:
         """ Retrieve the name of the health-topic group class based on the
@@ -125,13 +582,7 @@ class IngesterMedlineGroups(IngesterDocumentBase):
                 or `None` if none was found.
         """
 
-        for entry in self.health_topic_group_classes:
-            health_topic_group_class_name = entry["name"]
-            for health_topic_group in entry["health_topic_groups"]:
-                if health_topic_group["name"] == health_topic_group_name:
-                    return health_topic_group_class_name
-
-        return None
+        return self._group_to_class.get(health_topic_group_name)
 
     @log_ingestion_of_document(document_name="group")
     def ingest(self, document: Dict) -> Optional[int]:
@@ -149,32 +600,79 @@ class IngesterMedlineGroups(IngesterDocumentBase):
         if not document:
             return None
 
-        group_name = document["name"]
+        return self.ingest_many(documents=[document])[0]
+
+    def ingest_many(self, documents: List[Dict]) -> List[Optional[int]]:
+        """ Ingests multiple parsed elements of type `<group>` and upserts the
+            `HealthTopicGroup` records in a single statement retrieving each
+            referenced `HealthTopicGroupClass` record only once.
+
+        Args:
+            documents (List[Dict]): The elements of type `<group`> parsed into
+                dictionaries.
+
+        Returns:
+             List[Optional[int]]: The primary-key IDs of the `HealthTopicGroup`
+                records in the order of the provided documents.
+        """
+
+        self.logger.debug(f"Ingesting {len(documents)} 'group' documents")
 
         # Retrieve the name of the health-topic group class name that includes
-        # the given group.
-        class_name = self._get_group_class(health_topic_group_name=group_name)
+        # each group.
+        class_names = {}
+        for document in documents:
+            if not document:
+                continue
+
+            group_name = document["name"]
+            class_name = self._get_group_class(
+                health_topic_group_name=group_name
+            )
 
-        if not class_name:
-            raise ValueError
+            if not class_name:
+                raise ValueError
 
-        # Retrieve the matching `HealthTopicGroupClass` object.
-        # noinspection PyTypeChecker
-        obj_class = self.dal.get_by_attr(
+            class_names[group_name] = class_name
+
+        # Retrieve the PK IDs of the matching `HealthTopicGroupClass` records.
+        class_ids = self._get_ids_by_attr(
             orm_class=HealthTopicGroupClass,
             attr_name="name",
-            attr_value=class_name,
-        )  # type: HealthTopicGroupClass
+            attr_values=class_names.values(),
+        )
 
-        if not obj_class:
-            raise ValueError
+        # Upsert the `HealthTopicGroup` records of all documents and retrieve
+        # their PK IDs keyed on their UI.
+        rows = []
+        for document in documents:
+            if not document:
+                continue
+
+            class_name = class_names[document["name"]]
+            if class_name not in class_ids:
+                raise ValueError
+
+            rows.append(
+                {
+                    "ui": str(document["id"]),
+                    "name": document["name"],
+                    "url": document["url"],
+                    "health_topic_group_class_id": class_ids[class_name],
+                }
+            )
 
-        self.dal.iodu_health_topic_group(
-            ui=str(document["id"]),
-            name=document["name"],
-            url=document["url"],
-            health_topic_group_class_id=obj_class.health_topic_group_class_id,
+        health_topic_group_ids_by_ui = self._bulk_iodu(
+            orm_class=HealthTopicGroup, rows=rows, index_element="ui"
         )
+        health_topic_group_ids = [
+            health_topic_group_ids_by_ui[str(document["id"])]
+            if document
+            else None
+            for document in documents
+        ]
+
+        return health_topic_group_ids
 
 
 class IngesterMedlineHealthTopics(IngesterDocumentBase):
@@ -194,94 +692,124 @@ class IngesterMedlineHealthTopics(IngesterDocumentBase):
             dal (DalMedline): The DAL to be used to interact with the database.
         """
 
-        super(IngesterMedlineHealthTopics, self).__init__(
-            dal=dal, kwargs=kwargs
-        )
+        super().__init__(dal=dal, **kwargs)
 
-        self.health_topic_body_parts = health_topic_body_parts
-
-    def _get_topic_body_parts(self, health_topic_name: str) -> List[str]:
-        """ Retrieve the names of the body parts based on the name of the
-            health-topic from the scraped data.
-
-        Args:
-            health_topic_name (str): The name of the health-topic.
-
-        Returns:
-            List[str]: The name of the encompassing body parts.
-        """
+        # Index the names of the body-parts by the names of the health-topics
+        # they encompass. The index is frozen into tuples as it's only read
+        # from hereon.
+        topic_to_body_parts = collections.defaultdict(list)
+        for entry in health_topic_body_parts:
+            for health_topic in entry["health_topics"]:
+                topic_to_body_parts[health_topic["name"]].append(entry["name"])
 
-        body_part_names = []
+        self._topic_to_body_parts = {
+            health_topic_name: tuple(names)
+            for health_topic_name, names in topic_to_body_parts.items()
+        }  # type: Dict[str, Tuple[str, ...]]
 
-        for entry in self.health_topic_body_parts:
-            body_part_name = entry["name"]
-            for health_topic in entry["health_topics"]:
-                if health_topic["name"] == health_topic_name:
-                    body_part_names.append(body_part_name)
+        # Links to related health-topics buffered by `ingest_many` until all
+        # health-topics have been ingested and `ingest_links` is called.
+        self._links = []  # type: List[Tuple[int, str]]
 
-        return body_part_names
+    @classmethod
+    def _copy_links(
+        cls, links: List[Tuple[int, str]], session: sqlalchemy.orm.Session
+    ) -> None:
+        """ Creates the `HealthTopicRelatedHealthTopic` records for links
+            between health-topics by copying the links into a staging table
+            and resolving the related `HealthTopic` records through a single
+            `INSERT ... SELECT ... JOIN` on their UI.
 
-    @log_ingestion_of_document(document_name="also-called")
-    def ingest_also_called(self, document: Dict) -> Optional[int]:
-        """ Ingests a parsed element of type `<also-called>` and creates a
-            `AlsoCalled` record.
+        Links to health-topics that haven't been ingested, or that lack a UI,
+        are skipped.
 
         Args:
-            document (Dict): The element of type `<also-called>` parsed into a
-                dictionary.
-
-        Returns:
-             int: The primary-key ID of the `AlsoCalled` record.
+            links (List[Tuple[int, str]]): The links as tuples of the PK ID of
+                the linking `HealthTopic` record and the UI of the related one.
+            session (sqlalchemy.orm.Session): The session to perform the insert
+                in.
         """
 
-        if not document:
-            return None
+        links = [
+            (health_topic_id, related_ui)
+            for health_topic_id, related_ui in links
+            if health_topic_id is not None and related_ui is not None
+        ]
 
-        obj_id = self.dal.iodi_also_called(name=document["name"])
+        if not links:
+            return None
 
-        return obj_id
+        table = HealthTopicRelatedHealthTopic.__table__
+        table_health_topic = HealthTopic.__table__
+        column_pk = sqlalchemy.inspect(HealthTopic).primary_key[0].name
+
+        cls._copy_via_temp_table(
+            table_tmp="tmp_{0}".format(table.name),
+            columns=["health_topic_id", "related_ui"],
+            rows=links,
+            sql_select=(
+                "SELECT {0} AS health_topic_id, ui AS related_ui "
+                "FROM {1}".format(column_pk, table_health_topic.fullname)
+            ),
+            sql_insert=(
+                "INSERT INTO {0} (health_topic_id, related_health_topic_id) "
+                "SELECT DISTINCT s.health_topic_id, t.{1} "
+                "FROM {{table_tmp}} AS s JOIN {2} AS t "
+                "ON t.ui = s.related_ui "
+                "ON CONFLICT DO NOTHING".format(
+                    table.fullname, column_pk, table_health_topic.fullname
+                )
+            ),
+            session=session,
+        )
 
-    @log_ingestion_of_document(document_name="primary-institute")
-    def ingest_primary_institute(self, document: Dict) -> Optional[int]:
-        """ Ingests a parsed element of type `<primary-institute>` and creates a
-            `PrimaryInstitute` record.
+    def _get_id_or_warn(
+        self,
+        ids: Dict[Any, int],
+        value: Any,
+        document_name: str,
+        health_topic_title: str,
+    ) -> Optional[int]:
+        """ Retrieves the primary-key ID of a record referenced by a
+            health-topic logging a warning if the record wasn't found so that
+            the association is skipped rather than failing the entire batch.
 
         Args:
-            document (Dict): The element of type `<primary-institute>` parsed
-                into a dictionary.
+            ids (Dict[Any, int]): The primary-key IDs of the referenced records
+                keyed on the values they're referenced by.
+            value (Any): The value the record is referenced by.
+            document_name (str): The name of the referenced document type used
+                in the warning.
+            health_topic_title (str): The title of the referencing health-topic
+                used in the warning.
 
         Returns:
-             int: The primary-key ID of the `PrimaryInstitute` record.
+            Optional[int]: The primary-key ID of the referenced record or
+                `None` if it wasn't found.
         """
 
-        if not document:
-            return None
+        obj_id = ids.get(value)
 
-        obj_id = self.dal.iodu_primary_institute(
-            name=document["name"], url=document["url"]
-        )
+        if obj_id is None:
+            self.logger.warning(
+                f"The {document_name} '{value}' referenced by health-topic "
+                f"'{health_topic_title}' was not found. Skipping."
+            )
 
         return obj_id
 
-    @log_ingestion_of_document(document_name="see-reference")
-    def ingest_see_reference(self, document: Dict) -> Optional[int]:
-        """ Ingests a parsed element of type `<see-reference>` and creates a
-            `SeeReference` record.
+    def _get_topic_body_parts(self, health_topic_name: str) -> List[str]:
+        """ Retrieve the names of the body parts based on the name of the
+            health-topic from the scraped data.
 
         Args:
-            document (Dict): The element of type `<see-reference>` parsed into a
-                dictionary.
+            health_topic_name (str): The name of the health-topic.
 
         Returns:
-             int: The primary-key ID of the `SeeReference` record.
+            List[str]: The name of the encompassing body parts.
         """
 
-        if not document:
-            return None
-
-        obj_id = self.dal.iodi_see_reference(name=document["name"])
-
-        return obj_id
+        return list(self._topic_to_body_parts.get(health_topic_name, ()))
 
     @log_ingestion_of_document(document_name="health-topic")
     def ingest(self, document: Dict, do_ingest_links: bool) -> Optional[int]:
@@ -292,9 +820,9 @@ class IngesterMedlineHealthTopics(IngesterDocumentBase):
             document (Dict): The element of type `<health-topic>` parsed into a
                 dictionary.
             do_ingest_links (bool): Whether to ingest links to other related
-                health-topics. This is set to `False` to perform an initial of
-                all topics while the second run should set it to `True` so that
-                the links can be set after all topics have been ingested.
+                health-topics. When set to `False` the links are buffered
+                and can be ingested through `ingest_links` after all topics
+                have been ingested.
 
         Returns:
              int: The primary-key ID of the `HealthTopic` record.
@@ -303,115 +831,299 @@ class IngesterMedlineHealthTopics(IngesterDocumentBase):
         if not document:
             return None
 
-        # Upsert the `PrimaryInstitute` record.
-        primary_institute_id = self.ingest_primary_institute(
-            document=document["primary-institute"]
-        )
+        return self.ingest_many(
+            documents=[document], do_ingest_links=do_ingest_links
+        )[0]
+
+    def ingest_many(
+        self, documents: List[Dict], do_ingest_links: bool
+    ) -> List[Optional[int]]:
+        """ Ingests multiple parsed elements of type `<health-topic>` and
+            creates the `HealthTopic` records.
+
+        The `HealthTopic` records and the referenced records are upserted or
+        retrieved once per distinct value across all documents while the
+        association records of all documents are copied into the database with
+        a single `COPY` per table. All records are ingested within a single
+        transaction so that a failed batch leaves no records behind.
+
+        Args:
+            documents (List[Dict]): The elements of type `<health-topic>` parsed
+                into dictionaries.
+            do_ingest_links (bool): Whether to ingest links to other related
+                health-topics. When set to `False` the links are buffered
+                and can be ingested through `ingest_links` after all topics
+                have been ingested.
 
-        health_topic_id = self.dal.iodu_health_topic(
-            ui=str(document["id"]),
-            title=document["title"],
-            url=document["url"],
-            description=document["meta-desc"],
-            summary=document["full-summary"],
-            date_created=document["date-created"],
-            primary_institute_id=primary_institute_id,
+        Returns:
+             List[Optional[int]]: The primary-key IDs of the `HealthTopic`
+                records in the order of the provided documents.
+        """
+
+        self.logger.debug(
+            f"Ingesting {len(documents)} 'health-topic' documents"
         )
 
-        # Upsert the `AlsoCalled` records and retrieve their PK IDs.
-        also_called_ids = []
-        for also_called in document["also-calleds"]:
-            also_called_id = self.ingest_also_called(document=also_called)
-            also_called_ids.append(also_called_id)
+        valid_documents = [document for document in documents if document]
+
+        # Ingest all records of the batch within a single transaction.
+        with self.bulk_load() as session:
+            # Upsert the distinct `PrimaryInstitute` records of all documents
+            # and retrieve their PK IDs keyed on their URL.
+            primary_institute_ids = self._bulk_iodu(
+                orm_class=PrimaryInstitute,
+                rows=[
+                    {
+                        "name": document["primary-institute"]["name"],
+                        "url": document["primary-institute"]["url"],
+                    }
+                    for document in valid_documents
+                    if document["primary-institute"]
+                ],
+                index_element="url",
+                session=session,
+            )
 
-        # Upsert the `HealthTopicAlsoCalled` records.
-        for also_called_id in also_called_ids:
-            self.dal.iodi_health_topic_also_called(
-                health_topic_id=health_topic_id, also_called_id=also_called_id
+            # Insert the `AlsoCalled` and `SeeReference` records of all
+            # documents and retrieve their PK IDs.
+            also_called_ids = self._bulk_iodi_names(
+                orm_class=AlsoCalled,
+                names=[
+                    also_called["name"]
+                    for document in valid_documents
+                    for also_called in document["also-calleds"]
+                ],
+                session=session,
             )
+            see_reference_ids = self._bulk_iodi_names(
+                orm_class=SeeReference,
+                names=[
+                    see_reference["name"]
+                    for document in valid_documents
+                    for see_reference in document["see-references"]
+                ],
+                session=session,
+            )
+
+            # Retrieve the names of the body-parts of each health-topic.
+            body_part_names = {
+                document["title"]: self._get_topic_body_parts(
+                    health_topic_name=document["title"]
+                )
+                for document in valid_documents
+            }
 
-        # Retrieve the PK IDs of the related `HealthTopicGroup` records.
-        health_topic_group_ids = []
-        for group in document["groups"]:
-            # noinspection PyTypeChecker
-            obj_group = self.dal.get_by_attr(
+            # Retrieve the PK IDs of the related `HealthTopicGroup`,
+            # `Descriptor`, and `BodyPart` records.
+            health_topic_group_ids = self._get_ids_by_attr(
                 orm_class=HealthTopicGroup,
                 attr_name="name",
-                attr_value=group["name"],
-            )  # type: HealthTopicGroup
-            health_topic_group_ids.append(obj_group.health_topic_group_id)
-
-        # Upsert the `HealthTopicHealthTopicGroup` records.
-        for health_topic_group_id in health_topic_group_ids:
-            self.dal.iodi_health_topic_health_topic_group(
-                health_topic_id=health_topic_id,
-                health_topic_group_id=health_topic_group_id,
+                attr_values=[
+                    group["name"]
+                    for document in valid_documents
+                    for group in document["groups"]
+                ],
+                session=session,
             )
-
-        # Retrieve the PK IDs of the related `Descriptor` records.
-        descriptor_ids = []
-        for mesh_heading in document["mesh-headings"]:
-            # noinspection PyTypeChecker
-            obj_descriptor = self.dal.get_by_attr(
+            descriptor_ids = self._get_ids_by_attr(
                 orm_class=Descriptor,
                 attr_name="ui",
-                attr_value=mesh_heading["descriptor"]["id"],
-            )  # type: Descriptor
-            descriptor_ids.append(obj_descriptor.descriptor_id)
-
-        # Upsert the `HealthTopicDescriptor` records.
-        for descriptor_id in descriptor_ids:
-            self.dal.iodi_health_topic_descriptor(
-                health_topic_id=health_topic_id, descriptor_id=descriptor_id
+                attr_values=[
+                    mesh_heading["descriptor"]["id"]
+                    for document in valid_documents
+                    for mesh_heading in document["mesh-headings"]
+                ],
+                session=session,
+            )
+            body_part_ids = self._get_ids_by_attr(
+                orm_class=BodyPart,
+                attr_name="name",
+                attr_values=[
+                    body_part_name
+                    for names in body_part_names.values()
+                    for body_part_name in names
+                ],
+                session=session,
             )
 
-        if do_ingest_links:
-            # Retrieve the PK IDs of the related `HealthTopic` records.
-            related_health_topic_ids = []
-            for related_topic in document["related-topics"]:
-                # noinspection PyTypeChecker
-                obj_group = self.dal.get_by_attr(
-                    orm_class=HealthTopic,
-                    attr_name="ui",
-                    attr_value=related_topic["id"],
-                )  # type: HealthTopic
-                related_health_topic_ids.append(obj_group.health_topic_id)
-
-            # Upsert the `HealthTopicRelatedHealthTopic` records.
-            for related_health_topic_id in related_health_topic_ids:
-                self.dal.iodi_health_topic_related_health_topic(
-                    health_topic_id=health_topic_id,
-                    related_health_topic_id=related_health_topic_id,
+            # Upsert the `HealthTopic` records of all documents and retrieve
+            # their PK IDs keyed on their UI.
+            health_topic_ids_by_ui = self._bulk_iodu(
+                orm_class=HealthTopic,
+                rows=[
+                    {
+                        "ui": str(document["id"]),
+                        "title": document["title"],
+                        "url": document["url"],
+                        "description": document["meta-desc"],
+                        "summary": document["full-summary"],
+                        "date_created": document["date-created"],
+                        "primary_institute_id": primary_institute_ids.get(
+                            document["primary-institute"].get("url")
+                        ),
+                    }
+                    for document in valid_documents
+                ],
+                index_element="ui",
+                session=session,
+            )
+            health_topic_ids = [
+                health_topic_ids_by_ui[str(document["id"])]
+                if document
+                else None
+                for document in documents
+            ]
+
+            # Assemble the association records of all documents.
+            rows_also_called = []
+            rows_health_topic_group = []
+            rows_descriptor = []
+            rows_see_reference = []
+            rows_body_part = []
+            for document, health_topic_id in zip(documents, health_topic_ids):
+                if not document:
+                    continue
+
+                title = document["title"]
+
+                for also_called in document["also-calleds"]:
+                    if not also_called["name"]:
+                        continue
+                    also_called_id = self._get_id_or_warn(
+                        ids=also_called_ids,
+                        value=also_called["name"],
+                        document_name="also-called",
+                        health_topic_title=title,
+                    )
+                    if also_called_id is not None:
+                        rows_also_called.append(
+                            {
+                                "health_topic_id": health_topic_id,
+                                "also_called_id": also_called_id,
+                            }
+                        )
+
+                for group in document["groups"]:
+                    health_topic_group_id = self._get_id_or_warn(
+                        ids=health_topic_group_ids,
+                        value=group["name"],
+                        document_name="group",
+                        health_topic_title=title,
+                    )
+                    if health_topic_group_id is not None:
+                        rows_health_topic_group.append(
+                            {
+                                "health_topic_id": health_topic_id,
+                                "health_topic_group_id": health_topic_group_id,
+                            }
+                        )
+
+                for mesh_heading in document["mesh-headings"]:
+                    descriptor_id = self._get_id_or_warn(
+                        ids=descriptor_ids,
+                        value=mesh_heading["descriptor"]["id"],
+                        document_name="descriptor",
+                        health_topic_title=title,
+                    )
+                    if descriptor_id is not None:
+                        rows_descriptor.append(
+                            {
+                                "health_topic_id": health_topic_id,
+                                "descriptor_id": descriptor_id,
+                            }
+                        )
+
+                for see_reference in document["see-references"]:
+                    if not see_reference["name"]:
+                        continue
+                    see_reference_id = self._get_id_or_warn(
+                        ids=see_reference_ids,
+                        value=see_reference["name"],
+                        document_name="see-reference",
+                        health_topic_title=title,
+                    )
+                    if see_reference_id is not None:
+                        rows_see_reference.append(
+                            {
+                                "health_topic_id": health_topic_id,
+                                "see_reference_id": see_reference_id,
+                            }
+                        )
+
+                for body_part_name in body_part_names[title]:
+                    body_part_id = self._get_id_or_warn(
+                        ids=body_part_ids,
+                        value=body_part_name,
+                        document_name="body-part",
+                        health_topic_title=title,
+                    )
+                    if body_part_id is not None:
+                        rows_body_part.append(
+                            {
+                                "health_topic_id": health_topic_id,
+                                "body_part_id": body_part_id,
+                            }
+                        )
+
+            # Assemble the links to related health-topics of all documents
+            # which are either ingested right away or buffered, once the
+            # transaction has been committed, until `ingest_links` is called.
+            links = [
+                (health_topic_id, related_topic["id"])
+                for document, health_topic_id in zip(
+                    documents, health_topic_ids
                 )
-
-        # Upsert the `SeeReference` records and retrieve their PK IDs.
-        see_reference_ids = []
-        for see_reference in document["see-references"]:
-            see_reference_id = self.ingest_see_reference(document=see_reference)
-            see_reference_ids.append(see_reference_id)
-
-        # Upsert the `HealthTopicSeeReference` records.
-        for see_reference_id in see_reference_ids:
-            self.dal.iodi_health_topic_see_reference(
-                health_topic_id=health_topic_id,
-                see_reference_id=see_reference_id,
+                if document
+                for related_topic in document["related-topics"]
+            ]
+            links_buffered = []  # type: List[Tuple[int, str]]
+            if not do_ingest_links:
+                links_buffered, links = links, []
+
+            # Copy the association records of all documents.
+            self._copy_iodi(
+                orm_class=HealthTopicAlsoCalled,
+                rows=rows_also_called,
+                session=session,
             )
-
-        # Retrieve the names of the body-parts the
-        body_part_names = self._get_topic_body_parts(
-            health_topic_name=document["title"]
-        )
-        # Retrieve the PK IDs of the related `BodyPart` records.
-        body_part_ids = []
-        for body_part_name in body_part_names:
-            # noinspection PyTypeChecker
-            obj_body_part = self.dal.get_by_attr(
-                orm_class=BodyPart, attr_name="name", attr_value=body_part_name
-            )  # type: BodyPart
-            body_part_ids.append(obj_body_part.body_part_id)
-
-        # Upsert the `HealthTopicBodyPart` records.
-        for body_part_id in body_part_ids:
-            self.dal.iodi_health_topic_body_part(
-                health_topic_id=health_topic_id, body_part_id=body_part_id
+            self._copy_iodi(
+                orm_class=HealthTopicHealthTopicGroup,
+                rows=rows_health_topic_group,
+                session=session,
+            )
+            self._copy_iodi(
+                orm_class=HealthTopicDescriptor,
+                rows=rows_descriptor,
+                session=session,
+            )
+            self._copy_iodi(
+                orm_class=HealthTopicSeeReference,
+                rows=rows_see_reference,
+                session=session,
             )
+            self._copy_iodi(
+                orm_class=HealthTopicBodyPart,
+                rows=rows_body_part,
+                session=session,
+            )
+            self._copy_links(links=links, session=session)
+
+        self._links.extend(links_buffered)
+
+        return health_topic_ids
+
+    def ingest_links(self) -> None:
+        """ Ingests the links to related health-topics buffered by previous
+            `ingest_many` calls with `do_ingest_links` set to `False`.
+
+        This is meant to be called once all health-topics have been ingested
+        so that links can be established without parsing and ingesting the
+        health-topics a second time.
+        """
+
+        self.logger.debug(f"Ingesting {len(self._links)} health-topic links")
+
+        with self.bulk_load() as session:
+            self._copy_links(links=self._links, session=session)
+
+        self._links = []
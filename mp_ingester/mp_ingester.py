@@ -6,9 +6,11 @@
 import os
 import argparse
 import asyncio
-from typing import Dict
+import concurrent.futures
+import functools
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional
+from typing import Type
 
-import wget
 from fform.dals_mp import DalMedline
 
 from mp_ingester.parsers import ParserXmlMedlineGroups
@@ -22,8 +24,125 @@ from mp_ingester.ingesters import IngesterMedlineGroupClasses
 from mp_ingester.ingesters import IngesterMedlineBodyParts
 from mp_ingester.ingesters import IngesterMedlineGroups
 from mp_ingester.ingesters import IngesterMedlineHealthTopics
+from mp_ingester.ingesters import IngesterDocumentBase
 from mp_ingester.config import import_config
 from mp_ingester.sentry import initialize_sentry
+from mp_ingester.utils import cache_to_json_file
+from mp_ingester.utils import generate_batches
+
+
+# Number of documents ingested per `ingest_many` call.
+BATCH_SIZE = 1000
+
+# Maximum number of parsed batches buffered between the parser and ingester.
+QUEUE_SIZE = 4
+
+# Maximum number of worker processes used by `_ingest_parallel` and the
+# minimum number of documents for which they're used at all.
+MAX_WORKERS = 4
+MIN_DOCUMENTS_PARALLEL = 10 * BATCH_SIZE
+
+# DAL used by the worker processes spawned in `_ingest_parallel`.
+_worker_dal = None  # type: Optional[DalMedline]
+
+
+def _init_worker_dal(sql_kwargs: Dict) -> None:
+    """ Initializes the DAL of a worker process so that each worker uses its
+        own database connection.
+
+    Args:
+        sql_kwargs (Dict): The SQL connection arguments of the DAL.
+    """
+
+    global _worker_dal
+
+    _worker_dal = DalMedline(**sql_kwargs)
+
+
+def _ingest_shard(
+    ingester_class: Type[IngesterDocumentBase],
+    ingester_kwargs: Dict,
+    documents: List,
+) -> None:
+    """ Ingests a shard of documents within a worker process."""
+
+    ingester = ingester_class(dal=_worker_dal, **ingester_kwargs)
+    for batch in generate_batches(items=documents, batch_size=BATCH_SIZE):
+        ingester.ingest_many(documents=batch)
+
+
+def _ingest_parallel(
+    cfg,
+    ingester_class: Type[IngesterDocumentBase],
+    documents: List,
+    key: Callable[[Any], Hashable],
+    ingester_kwargs: Optional[Dict] = None,
+    num_workers: Optional[int] = None,
+) -> None:
+    """ Splits the documents into shards and ingests them in parallel worker
+        processes each with its own DAL and database connection.
+
+    This should only be used for documents that don't depend on one another
+    as the shards are ingested in separate transactions in no given order.
+    Documents sharing the same conflict key are placed in the same shard so
+    that concurrent upserts never contend for the same rows. Fewer documents
+    than `MIN_DOCUMENTS_PARALLEL` are ingested within the current process.
+
+    Args:
+        cfg: The loaded configuration.
+        ingester_class (Type[IngesterDocumentBase]): The ingester class to
+            ingest the documents with.
+        documents (List): The documents to ingest.
+        key (Callable[[Any], Hashable]): The callable returning the conflict
+            key of a document, i.e., the value of the uniquely constrained
+            column of the records it's upserted as.
+        ingester_kwargs (Optional[Dict]): Additional keyword arguments passed
+            to the ingester constructor.
+        num_workers (Optional[int]): The number of worker processes. Defaults
+            to the number of CPUs capped to `MAX_WORKERS`.
+    """
+
+    sql_kwargs = {
+        "sql_username": cfg.sql_username,
+        "sql_password": cfg.sql_password,
+        "sql_host": cfg.sql_host,
+        "sql_port": cfg.sql_port,
+        "sql_db": cfg.sql_db,
+    }
+
+    # Spawning workers isn't worth it for a handful of documents.
+    if len(documents) < MIN_DOCUMENTS_PARALLEL:
+        _init_worker_dal(sql_kwargs=sql_kwargs)
+        _ingest_shard(
+            ingester_class=ingester_class,
+            ingester_kwargs=ingester_kwargs or {},
+            documents=documents,
+        )
+        return None
+
+    num_workers = min(num_workers or os.cpu_count() or 1, MAX_WORKERS)
+
+    # Partition the documents by their conflict key.
+    shards = [[] for _ in range(num_workers)]  # type: List[List]
+    for document in documents:
+        shards[hash(key(document)) % num_workers].append(document)
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=num_workers,
+        initializer=_init_worker_dal,
+        initargs=(sql_kwargs,),
+    ) as executor:
+        futures = [
+            executor.submit(
+                _ingest_shard, ingester_class, ingester_kwargs or {}, shard
+            )
+            for shard in shards
+            if shard
+        ]
+
+        # Retrieve the results to re-raise any exception raised in a worker.
+        for future in futures:
+            future.result()
 
 
 def load_config(args):
@@ -39,11 +158,72 @@ def load_config(args):
     return cfg
 
 
+async def _ingest_pipelined(
+    documents: Iterable, ingest: Callable[[List], None]
+) -> None:
+    """ Ingests documents in batches while overlapping the production of the
+        documents, e.g., the parsing of an XML file, with their ingestion.
+
+    Both the production of the batches and their ingestion are run in the
+    default executor and are connected through a bounded queue so that the
+    parser keeps running while the previous batch is being ingested. Should
+    either fail the other is cancelled and the exception is re-raised.
+
+    Args:
+        documents (Iterable): The documents to ingest.
+        ingest (Callable[[List], None]): The callable ingesting a batch of
+            documents.
+    """
+
+    loop = asyncio.get_event_loop()
+    queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+    batches = generate_batches(items=documents, batch_size=BATCH_SIZE)
+
+    async def produce():
+        while True:
+            batch = await loop.run_in_executor(None, next, batches, None)
+            await queue.put(batch)
+            # A `None` batch signals the end of the batches.
+            if batch is None:
+                break
+
+    async def consume():
+        while True:
+            batch = await queue.get()
+            if batch is None:
+                break
+            await loop.run_in_executor(None, ingest, batch)
+
+    producer = asyncio.ensure_future(produce())
+    consumer = asyncio.ensure_future(consume())
+
+    try:
+        # Wait for both tasks to complete or either of them to fail and
+        # re-raise the exception of a failed task.
+        done, _ = await asyncio.wait(
+            {producer, consumer}, return_when=asyncio.FIRST_EXCEPTION
+        )
+        for task in done:
+            task.result()
+    finally:
+        # Cancel the task that's still running after the other one failed, or
+        # both if this coroutine was cancelled, and wait for it to wind down
+        # so no task is left pending.
+        for task in (producer, consumer):
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(producer, consumer, return_exceptions=True)
+
+
+@cache_to_json_file(
+    filename_cache="/tmp/mplus_topic_group_classes.json",
+    key_args=["medline_health_topics_url"],
+)
 async def _scrape_health_topic_group_classes(
-    medline_health_topics_url: str
+    medline_health_topics_url: str, cache_dir: Optional[str] = None
 ) -> TypeHealthTopicGroupClasses:
     # Scrape MedlinePlus for the health-topic group classes.
-    scraper_classes = ScraperHealthTopicGroupClasses()
+    scraper_classes = ScraperHealthTopicGroupClasses(cache_dir=cache_dir)
     health_topic_group_classes = await scraper_classes.scrape(
         medline_health_topics_url=medline_health_topics_url
     )
@@ -53,65 +233,85 @@ async def _scrape_health_topic_group_classes(
 
 async def _scrape_health_topic_body_parts(
     health_topic_group_classes: TypeHealthTopicGroupClasses,
+    cache_dir: Optional[str] = None,
 ) -> TypeHealthTopicBodyParts:
-    tasks = []
-    scraper_body_parts = ScraperHealthTopicGroupBodyParts()
-    # Scrape MedlinePlus for the health-topic body-parts.
-    for health_topic_group_class in health_topic_group_classes:
-        health_topic_groups = health_topic_group_class["health_topic_groups"]
-        for health_topic_group in health_topic_groups:
-
-            tasks.append(
-                scraper_body_parts.scrape(
-                    medline_health_topic_group_url=health_topic_group["url"]
-                )
-            )
-
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-
-    health_topic_body_parts = []
-    for result in results:
-        if isinstance(result, Exception):
-            raise result
-        health_topic_body_parts.extend(result)
+    scraper_body_parts = ScraperHealthTopicGroupBodyParts(cache_dir=cache_dir)
+
+    urls = [
+        health_topic_group["url"]
+        for health_topic_group_class in health_topic_group_classes
+        for health_topic_group in health_topic_group_class[
+            "health_topic_groups"
+        ]
+    ]
+
+    # Scrape the MedlinePlus health-topic group pages for the health-topic
+    # body-parts concurrently over a single shared HTTP session.
+    async with scraper_body_parts:
+        health_topic_body_parts = await scraper_body_parts.scrape_many(
+            medline_health_topic_group_urls=urls
+        )
 
     return health_topic_body_parts
 
 
-async def _scrape_medline_files(medline_xml_files_url: str) -> Dict[str, str]:
+@cache_to_json_file(
+    filename_cache="/tmp/mplus_xml_files.json",
+    key_args=["medline_xml_files_url"],
+)
+async def _scrape_medline_files(
+    scraper_files: ScraperMedlineFiles, medline_xml_files_url: str
+) -> Dict[str, str]:
     # Scrape MedlinePlus for the links to the latest XML files.
-    scraper_classes = ScraperMedlineFiles()
-    medline_xml_files = await scraper_classes.scrape(
+    medline_xml_files = await scraper_files.scrape(
         medline_xml_files_url=medline_xml_files_url
     )
 
     return medline_xml_files
 
 
-async def _download_file_groups(medline_xml_files_url: str) -> str:
-    filename_output = "/tmp/mplus_topic_groups.xml"
-    medline_xml_files = await _scrape_medline_files(
-        medline_xml_files_url=medline_xml_files_url
-    )
+async def _download_file(
+    medline_xml_files_url: str, file_key: str, cache_dir: Optional[str] = None
+) -> str:
+    filename_output = {
+        "health_topic_group_xml": "/tmp/mplus_topic_groups.xml",
+        "health_topic_xml": "/tmp/mplus_topics.xml",
+    }[file_key]
+
+    # Retrieve the links to the latest XML files and download the requested
+    # file over the same HTTP session.
+    scraper_files = ScraperMedlineFiles(cache_dir=cache_dir)
+    async with scraper_files:
+        medline_xml_files = await _scrape_medline_files(
+            scraper_files=scraper_files,
+            medline_xml_files_url=medline_xml_files_url,
+        )
 
-    wget.download(
-        url=medline_xml_files["health_topic_group_xml"], out=filename_output
-    )
+        await scraper_files.download_file(
+            url=medline_xml_files[file_key], filename_output=filename_output
+        )
 
     return filename_output
 
 
-async def _download_file_topic(medline_xml_files_url: str) -> str:
-    filename_output = "/tmp/mplus_topics.xml"
-    medline_xml_files = await _scrape_medline_files(
-        medline_xml_files_url=medline_xml_files_url
+async def _download_file_groups(
+    medline_xml_files_url: str, cache_dir: Optional[str] = None
+) -> str:
+    return await _download_file(
+        medline_xml_files_url=medline_xml_files_url,
+        file_key="health_topic_group_xml",
+        cache_dir=cache_dir,
     )
 
-    wget.download(
-        url=medline_xml_files["health_topic_xml"], out=filename_output
-    )
 
-    return filename_output
+async def _download_file_topic(
+    medline_xml_files_url: str, cache_dir: Optional[str] = None
+) -> str:
+    return await _download_file(
+        medline_xml_files_url=medline_xml_files_url,
+        file_key="health_topic_xml",
+        cache_dir=cache_dir,
+    )
 
 
 async def main(args):
@@ -120,6 +320,10 @@ async def main(args):
     # Initialize the Sentry agent.
     initialize_sentry(cfg=cfg)
 
+    # Directory the scraped MedlinePlus pages are cached under, if any, so that
+    # unchanged pages aren't re-downloaded.
+    http_cache_dir = getattr(cfg.medline, "http_cache_dir", None)
+
     dal = DalMedline(
         sql_username=cfg.sql_username,
         sql_password=cfg.sql_password,
@@ -131,19 +335,25 @@ async def main(args):
     if arguments.mode == "groups":
         # Scrape MedlinePlus for the health-topic group classes.
         health_topic_group_classes = await _scrape_health_topic_group_classes(
-            medline_health_topics_url=cfg.medline.health_topics_url
+            medline_health_topics_url=cfg.medline.health_topics_url,
+            cache_dir=http_cache_dir,
         )
 
         # Ingest the MedlinePlus health-topic group classes.
         ingester_classes = IngesterMedlineGroupClasses(dal=dal)
-        for health_topic_group_class in health_topic_group_classes:
-            ingester_classes.ingest(name=health_topic_group_class["name"])
+        ingester_classes.ingest_many(
+            names=[
+                health_topic_group_class["name"]
+                for health_topic_group_class in health_topic_group_classes
+            ]
+        )
 
         # If the filename of the XML file has not been specified then download
         # the file from the website.
         if not arguments.filename:
             filename_xml = await _download_file_groups(
-                medline_xml_files_url=cfg.medline.xml_files_url
+                medline_xml_files_url=cfg.medline.xml_files_url,
+                cache_dir=http_cache_dir,
             )
         else:
             filename_xml = arguments.filename
@@ -152,36 +362,43 @@ async def main(args):
         parser_groups = ParserXmlMedlineGroups()
         groups = parser_groups.parse(filename_xml=filename_xml)
 
-        # Ingest the MedlinePlus health-topic groups.
-        ingester_groups = IngesterMedlineGroups(
-            dal=dal, health_topic_group_classes=health_topic_group_classes
+        # Ingest the MedlinePlus health-topic groups across multiple processes.
+        _ingest_parallel(
+            cfg=cfg,
+            ingester_class=IngesterMedlineGroups,
+            documents=list(groups),
+            key=lambda document: document["id"],
+            ingester_kwargs={
+                "health_topic_group_classes": health_topic_group_classes
+            },
         )
-        for group in groups:
-            ingester_groups.ingest(document=group)
     elif arguments.mode == "topics":
         # Scrape MedlinePlus for the health-topic group classes.
         health_topic_group_classes = await _scrape_health_topic_group_classes(
-            medline_health_topics_url=cfg.medline.health_topics_url
+            medline_health_topics_url=cfg.medline.health_topics_url,
+            cache_dir=http_cache_dir,
         )
 
         # Scrape MedlinePlus for the health-topic body-parts.
         health_topic_body_parts = await _scrape_health_topic_body_parts(
-            health_topic_group_classes=health_topic_group_classes
+            health_topic_group_classes=health_topic_group_classes,
+            cache_dir=http_cache_dir,
         )
 
-        # Ingest the MedlinePlus body-parts.
-        ingester_body_parts = IngesterMedlineBodyParts(dal=dal)
-        for health_topic_body_part in health_topic_body_parts:
-            ingester_body_parts.ingest(
-                name=health_topic_body_part["name"],
-                health_topic_group_url=health_topic_body_part["group_url"],
-            )
+        # Ingest the MedlinePlus body-parts across multiple processes.
+        _ingest_parallel(
+            cfg=cfg,
+            ingester_class=IngesterMedlineBodyParts,
+            documents=health_topic_body_parts,
+            key=lambda document: document["name"],
+        )
 
         # If the filename of the XML file has not been specified then download
         # the file from the website.
         if not arguments.filename:
             filename_xml = await _download_file_topic(
-                medline_xml_files_url=cfg.medline.xml_files_url
+                medline_xml_files_url=cfg.medline.xml_files_url,
+                cache_dir=http_cache_dir,
             )
         else:
             filename_xml = arguments.filename
@@ -194,14 +411,17 @@ async def main(args):
         ingester_topics = IngesterMedlineHealthTopics(
             dal=dal, health_topic_body_parts=health_topic_body_parts
         )
-        # Ingest without ingesting links to related topics.
-        for topic in topics:
-            ingester_topics.ingest(document=topic, do_ingest_links=False)
+        # Ingest deferring the links to related topics as these may not have
+        # been ingested yet while parsing the next batch of topics.
+        await _ingest_pipelined(
+            documents=topics,
+            ingest=functools.partial(
+                ingester_topics.ingest_many, do_ingest_links=False
+            ),
+        )
 
-        # Re-ingest, this time including links to related topics.
-        topics = parser_topics.parse(filename_xml=filename_xml)
-        for topic in topics:
-            ingester_topics.ingest(document=topic, do_ingest_links=True)
+        # Ingest the links to related topics now that all topics are in.
+        ingester_topics.ingest_links()
 
 
 # main sentinel
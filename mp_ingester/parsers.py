@@ -7,15 +7,107 @@ containing the retrieved data.
 """
 
 import abc
+import collections
 import datetime
 import gzip
-from typing import List, Union, Dict, Optional, Iterable, BinaryIO, Any
+import io
+import os
+import sys
+from typing import (
+    List,
+    Union,
+    Dict,
+    Optional,
+    Iterable,
+    BinaryIO,
+    Any,
+    Callable,
+)
 
 from lxml import etree
 
+try:
+    import rapidgzip
+except ImportError:
+    rapidgzip = None
+
+try:
+    import indexed_gzip
+except ImportError:
+    indexed_gzip = None
+
 from mp_ingester.loggers import create_logger
 
 
+# Size, in bytes, of the read buffers used when opening XML files.
+READ_BUFFER_SIZE = 1 << 20
+
+
+def _et(element: etree.Element) -> Union[str, None]:
+    """ Extracts the text out of an XML element.
+
+    Args:
+        element (etree.Element): The XML element to extract the text form.
+
+    Returns:
+        Union[str, None]: The element's text or `None` if undefined or empty.
+    """
+
+    text = element.text if element is not None else None
+
+    return text.strip() if text else None
+
+
+def _interned(value: Optional[str]) -> Optional[str]:
+    """ Interns a string so that repeated values share a single object.
+
+    This is meant for values of low cardinality, e.g., the URLs and names of
+    health-topic groups, which are repeated across many health-topics.
+
+    Args:
+        value (Optional[str]): The string to intern.
+
+    Returns:
+        Optional[str]: The interned string or `None` if the value is undefined
+            or empty.
+    """
+
+    return sys.intern(value) if value else None
+
+
+def _parse_mdy(value: str) -> datetime.date:
+    """ Parses a date in the `MM/DD/YYYY` format used throughout the
+        MedlinePlus XML files.
+
+    Args:
+        value (str): The date string to parse.
+
+    Returns:
+        datetime.date: The parsed date.
+
+    Raises:
+        ValueError: Raised when the date string is malformed.
+    """
+
+    month, day, year = value.split("/")
+
+    return datetime.date(int(year), int(month), int(day))
+
+
+def _is_not_spanish(element: etree.Element) -> bool:
+    """ Checks whether an XML element does not describe a Spanish entity.
+
+    Args:
+        element (etree.Element): The XML element to check.
+
+    Returns:
+        bool: `False` if the element's `language` attribute is `Spanish`,
+            `True` otherwise.
+    """
+
+    return element.get("language") != "Spanish"
+
+
 class ParserXmlBase(object):
     """ XML parser base-class"""
 
@@ -28,60 +120,50 @@ class ParserXmlBase(object):
         )
 
     @staticmethod
-    def _et(element: etree.Element) -> Union[str, None]:
-        """ Extracts the text out of an XML element.
-
-        Args:
-            element (etree.Element): The XML element to extract the text form.
-
-        Returns:
-            Union[str, None]: The element's text or `None` if undefined or
-                empty.
-        """
-
-        text = None
-        if element is not None:
-            text = element.text
-
-        text = None if not text else text.strip()
-
-        return text
-
-    @staticmethod
-    def _eav(element: etree.Element, attribute: str) -> Union[str, None]:
-        """ Extracts the value of an XML element attribute.
+    def _collect_children(
+        element: etree.Element,
+    ) -> Dict[str, List[etree.Element]]:
+        """ Groups the direct children of an XML element by their tag through a
+            single pass over the children.
 
         Args:
-            element (etree.Element): The XML element to extract the attribute
-                value from.
-            attribute (str): The name of the attribute to extract.
+            element (etree.Element): The XML element whose children will be
+                grouped.
 
         Returns:
-            Union[str, None]: The element's text or `None` if undefined or
-                empty.
+            Dict[str, List[etree.Element]]: The children keyed on their tag in
+                document order.
         """
 
-        value = None
-        if element is not None:
-            value = element.get(attribute)
-
-        if not value:
-            value = None
+        # A `defaultdict` only allocates a list the first time a tag is seen
+        # unlike `setdefault` which allocates a list for every child.
+        buckets = collections.defaultdict(list)
+        for child in element:
+            buckets[child.tag].append(child)
 
-        return value
+        return buckets
 
     @staticmethod
     def generate_xml_elements(
         file_xml: Union[gzip.GzipFile, BinaryIO],
         element_tag: Optional[str] = None,
+        predicate: Optional[Callable[[etree.Element], bool]] = None,
     ) -> Iterable[etree.Element]:
         """ Parses an XML file and generates elements of a given type.
 
+        Elements are cleared and detached from the parsed tree once they have
+        been consumed thus keeping memory usage flat regardless of the size of
+        the XML file.
+
         Args:
             file_xml (Union[gzip.GzipFile, BinaryIO]): The opened XML file to
                 parse.
             element_tag: (ptional[str] = None): The tag of the elements to
                 retrieve and generate.
+            predicate (Optional[Callable[[etree.Element], bool]] = None): A
+                callable that elements must satisfy in order to be generated.
+                Elements that don't are discarded without being yielded.
+                Defaults to `None` in which case all elements are generated.
 
         Returns:
              Iterable[etree.Element]: An iterable of XML elements of the given
@@ -89,17 +171,27 @@ class ParserXmlBase(object):
         """
 
         document = etree.iterparse(
-            file_xml, events=("start", "end"), tag=element_tag
+            file_xml,
+            events=("end",),
+            tag=element_tag,
+            huge_tree=True,
+            remove_blank_text=True,
+            # Skip the ID index, entity resolution, and DTD loading, none of
+            # which are needed for the MedlinePlus XML files.
+            collect_ids=False,
+            resolve_entities=False,
+            load_dtd=False,
+            no_network=True,
         )
 
-        start_tag = None
-        for event, element in document:
-            if event == "start" and start_tag is None:
-                start_tag = element.tag
-            if event == "end" and element.tag == start_tag:
+        for _, element in document:
+            if predicate is None or predicate(element):
                 yield element
-                start_tag = None
-                element.clear()
+            element.clear(keep_tail=True)
+            # Delete the previously processed siblings of the element so that
+            # the parsed tree doesn't grow with the size of the file.
+            while element.getprevious() is not None:
+                del element.getparent()[0]
 
     def open_xml_file(
         self, filename_xml: str
@@ -116,10 +208,26 @@ class ParserXmlBase(object):
         msg_fmt = "Opening XML file '{0}'".format(filename_xml)
         self.logger.info(msg=msg_fmt)
 
+        # Gzipped files are decompressed in parallel through `rapidgzip` or
+        # through `indexed_gzip` when either is installed and are wrapped in a
+        # large buffer so that the parser reads decompressed data in big chunks
+        # rather than many small reads.
         if filename_xml.endswith(".gz"):
-            file_xml = gzip.GzipFile(filename=filename_xml, mode="rb")
+            if rapidgzip is not None:
+                file_gzip = rapidgzip.open(
+                    filename_xml, parallelization=os.cpu_count() or 1
+                )
+            elif indexed_gzip is not None:
+                file_gzip = indexed_gzip.IndexedGzipFile(
+                    filename_xml, buffer_size=READ_BUFFER_SIZE
+                )
+            else:
+                file_gzip = gzip.GzipFile(filename=filename_xml, mode="rb")
+            file_xml = io.BufferedReader(
+                file_gzip, buffer_size=READ_BUFFER_SIZE
+            )
         else:
-            file_xml = open(filename_xml, "rb")
+            file_xml = open(filename_xml, "rb", buffering=READ_BUFFER_SIZE)
 
         return file_xml
 
@@ -133,10 +241,13 @@ class ParserXmlMedlineGroups(ParserXmlBase):
         files.
     """
 
+    # Tag of the `<group>` XML elements.
+    TAG_GROUP = "group"
+
     def __init__(self, **kwargs):
         """ Constructor."""
 
-        super(ParserXmlMedlineGroups, self).__init__(kwargs=kwargs)
+        super().__init__(**kwargs)
 
     def parse_health_topic_group(
         self, element: etree.Element
@@ -154,14 +265,19 @@ class ParserXmlMedlineGroups(ParserXmlBase):
         if element is None:
             return {}
 
+        # Bind the attribute getter once as it's used for every attribute.
+        get = element.get
+
         # Skip Spanish entities.
-        if self._eav(element=element, attribute="language") == "Spanish":
+        if get("language") == "Spanish":
             return {}
 
+        text = element.text
+
         health_topic_group = {
-            "id": int(self._eav(element=element, attribute="id")),
-            "url": self._eav(element=element, attribute="url"),
-            "name": self._et(element=element),
+            "id": int(get("id")),
+            "url": get("url") or None,
+            "name": text.strip() if text else None,
         }
 
         return health_topic_group
@@ -188,21 +304,30 @@ class ParserXmlMedlineGroups(ParserXmlBase):
         file_xml = self.open_xml_file(filename_xml=filename_xml)
 
         # Retrieve an iterable that yields `<group>` XML elements from the XML
-        # file.
+        # file skipping Spanish entities before they're parsed.
         elements = self.generate_xml_elements(
-            file_xml=file_xml, element_tag="group"
+            file_xml=file_xml,
+            element_tag=self.TAG_GROUP,
+            predicate=_is_not_spanish,
         )
 
+        # Bind the element parser once instead of looking it up per element.
+        parse_health_topic_group = self.parse_health_topic_group
+
         # Iterate over the `<group>` elements and yield dictionaries with the
-        # parsed data.
-        for element in elements:
-            health_topic_group = self.parse_health_topic_group(element)
+        # parsed data. The file is closed once the elements are exhausted or
+        # the generator is abandoned.
+        try:
+            for element in elements:
+                health_topic_group = parse_health_topic_group(element)
 
-            # Guard against empty documents.
-            if not health_topic_group:
-                continue
+                # Guard against empty documents.
+                if not health_topic_group:
+                    continue
 
-            yield health_topic_group
+                yield health_topic_group
+        finally:
+            file_xml.close()
 
 
 class ParserXmlMedlineHealthTopic(ParserXmlBase):
@@ -210,10 +335,24 @@ class ParserXmlMedlineHealthTopic(ParserXmlBase):
         files.
     """
 
+    # Tags of the XML elements looked up while parsing `<health-topic>`
+    # elements. These are defined once so that the same string objects are
+    # reused for every lookup.
+    TAG_HEALTH_TOPIC = "health-topic"
+    TAG_ALSO_CALLED = "also-called"
+    TAG_FULL_SUMMARY = "full-summary"
+    TAG_GROUP = "group"
+    TAG_MESH_HEADING = "mesh-heading"
+    TAG_DESCRIPTOR = "descriptor"
+    TAG_QUALIFIER = "qualifier"
+    TAG_PRIMARY_INSTITUTE = "primary-institute"
+    TAG_RELATED_TOPIC = "related-topic"
+    TAG_SEE_REFERENCE = "see-reference"
+
     def __init__(self, **kwargs):
         """ Constructor."""
 
-        super(ParserXmlMedlineHealthTopic, self).__init__(kwargs=kwargs)
+        super().__init__(**kwargs)
 
     def parse_also_called(self, element: etree.Element) -> Dict:
         """ Parses an element of type `also-called` and returns the values of
@@ -229,32 +368,24 @@ class ParserXmlMedlineHealthTopic(ParserXmlBase):
         if element is None:
             return {}
 
-        also_called = {"name": self._et(element=element)}
+        also_called = {"name": _et(element=element)}
 
         return also_called
 
     def parse_also_calleds(
-        self, element_health_topic: etree.Element
+        self, elements: List[etree.Element]
     ) -> List[Optional[Dict]]:
-        """ Extracts and parses `<also-called>` elements from a `<health-topic>`
-            element and returns the values of the contained elements.
+        """ Parses `<also-called>` elements, extracted from a `<health-topic>`
+            element, and returns the values of the contained elements.
 
         Args:
-            element_health_topic (etree.Element): The `<health-topic>` element.
+            elements (List[etree.Element]): The `<also-called>` elements.
 
         Returns:
             List[Optional[Dict]]: The parsed values of the contained elements.
         """
 
-        also_calleds = []
-
-        if element_health_topic is None:
-            return also_calleds
-
-        for element in element_health_topic.findall("also-called"):
-            also_calleds.append(self.parse_also_called(element=element))
-
-        return also_calleds
+        return [self.parse_also_called(element=element) for element in elements]
 
     def parse_group(self, element: etree.Element) -> Dict:
         """ Parses an element of type `group` and returns the values of the
@@ -271,35 +402,27 @@ class ParserXmlMedlineHealthTopic(ParserXmlBase):
             return {}
 
         group = {
-            "id": int(self._eav(element=element, attribute="id")),
-            "url": self._eav(element=element, attribute="url"),
-            "name": self._et(element=element),
+            "id": int(element.get("id")),
+            "url": _interned(element.get("url")),
+            "name": _interned(_et(element=element)),
         }
 
         return group
 
     def parse_groups(
-        self, element_health_topic: etree.Element
+        self, elements: List[etree.Element]
     ) -> List[Optional[Dict]]:
-        """ Extracts and parses `<group>` elements from a `<health-topic>`
-            element and returns the values of the contained elements.
+        """ Parses `<group>` elements, extracted from a `<health-topic>`
+            element, and returns the values of the contained elements.
 
         Args:
-            element_health_topic (etree.Element): The `<health-topic>` element.
+            elements (List[etree.Element]): The `<group>` elements.
 
         Returns:
             List[Optional[Dict]]: The parsed values of the contained elements.
         """
 
-        groups = []
-
-        if element_health_topic is None:
-            return groups
-
-        for element in element_health_topic.findall("group"):
-            groups.append(self.parse_group(element=element))
-
-        return groups
+        return [self.parse_group(element=element) for element in elements]
 
     def parse_descriptor(self, element: etree.Element) -> Dict:
         """ Parses an element of type `descriptor` and returns the values of
@@ -316,8 +439,8 @@ class ParserXmlMedlineHealthTopic(ParserXmlBase):
             return {}
 
         descriptor = {
-            "id": self._eav(element=element, attribute="id"),
-            "name": self._et(element=element),
+            "id": _interned(element.get("id")),
+            "name": _interned(_et(element=element)),
         }
 
         return descriptor
@@ -337,34 +460,26 @@ class ParserXmlMedlineHealthTopic(ParserXmlBase):
             return {}
 
         qualifier = {
-            "id": self._eav(element=element, attribute="id"),
-            "name": self._et(element=element),
+            "id": _interned(element.get("id")),
+            "name": _interned(_et(element=element)),
         }
 
         return qualifier
 
     def parse_qualifiers(
-        self, element_mesh_heading: etree.Element
+        self, elements: List[etree.Element]
     ) -> List[Optional[Dict]]:
-        """ Extracts and parses `<qualifier>` elements from a `<mesh-heading>`
-            element and returns the values of the contained elements.
+        """ Parses `<qualifier>` elements, extracted from a `<mesh-heading>`
+            element, and returns the values of the contained elements.
 
         Args:
-            element_mesh_heading (etree.Element): The `<mesh-heading>` element.
+            elements (List[etree.Element]): The `<qualifier>` elements.
 
         Returns:
             List[Optional[Dict]]: The parsed values of the contained elements.
         """
 
-        qualifiers = []
-
-        if element_mesh_heading is None:
-            return qualifiers
-
-        for element in element_mesh_heading.findall("qualifier"):
-            qualifiers.append(self.parse_qualifier(element=element))
-
-        return qualifiers
+        return [self.parse_qualifier(element=element) for element in elements]
 
     def parse_mesh_heading(self, element: etree.Element) -> Dict:
         """ Parses an element of type `mesh-heading` and returns the values of
@@ -380,38 +495,36 @@ class ParserXmlMedlineHealthTopic(ParserXmlBase):
         if element is None:
             return {}
 
+        # Group the children of the `<mesh-heading>` element by tag.
+        children = self._collect_children(element=element)
+
         mesh_heading = {
             "descriptor": self.parse_descriptor(
-                element=element.find("descriptor")
+                element=children.get(self.TAG_DESCRIPTOR, [None])[0]
+            ),
+            "qualifiers": self.parse_qualifiers(
+                elements=children.get(self.TAG_QUALIFIER, [])
             ),
-            "qualifiers": self.parse_qualifiers(element_mesh_heading=element),
         }
 
         return mesh_heading
 
     def parse_mesh_headings(
-        self, element_health_topic: etree.Element
+        self, elements: List[etree.Element]
     ) -> List[Optional[Dict]]:
-        """ Extracts and parses `<mesh-heading>` elements from a
-            `<health-topic>` element and returns the values of the contained
-            elements.
+        """ Parses `<mesh-heading>` elements, extracted from a `<health-topic>`
+            element, and returns the values of the contained elements.
 
         Args:
-            element_health_topic (etree.Element): The `<health-topic>` element.
+            elements (List[etree.Element]): The `<mesh-heading>` elements.
 
         Returns:
             List[Optional[Dict]]: The parsed values of the contained elements.
         """
 
-        mesh_headings = []
-
-        if element_health_topic is None:
-            return mesh_headings
-
-        for element in element_health_topic.findall("mesh-heading"):
-            mesh_headings.append(self.parse_mesh_heading(element=element))
-
-        return mesh_headings
+        return [
+            self.parse_mesh_heading(element=element) for element in elements
+        ]
 
     def parse_primary_institute(self, element: etree.Element) -> Dict:
         """ Parses an element of type `primary-institute` and returns the values
@@ -428,8 +541,8 @@ class ParserXmlMedlineHealthTopic(ParserXmlBase):
             return {}
 
         primary_institute = {
-            "url": self._eav(element=element, attribute="url"),
-            "name": self._et(element=element),
+            "url": _interned(element.get("url")),
+            "name": _interned(_et(element=element)),
         }
 
         return primary_institute
@@ -449,36 +562,29 @@ class ParserXmlMedlineHealthTopic(ParserXmlBase):
             return {}
 
         related_topic = {
-            "url": self._eav(element=element, attribute="url"),
-            "id": self._eav(element=element, attribute="id"),
-            "name": self._et(element=element),
+            "url": element.get("url") or None,
+            "id": element.get("id") or None,
+            "name": _et(element=element),
         }
 
         return related_topic
 
     def parse_related_topics(
-        self, element_health_topic: etree.Element
+        self, elements: List[etree.Element]
     ) -> List[Optional[Dict]]:
-        """ Extracts and parses `<related-topic>` elements from a
-            `<health-topic>` element and returns the values of the contained
-            elements.
+        """ Parses `<related-topic>` elements, extracted from a `<health-topic>`
+            element, and returns the values of the contained elements.
 
         Args:
-            element_health_topic (etree.Element): The `<health-topic>` element.
+            elements (List[etree.Element]): The `<related-topic>` elements.
 
         Returns:
             List[Optional[Dict]]: The parsed values of the contained elements.
         """
 
-        related_topics = []
-
-        if element_health_topic is None:
-            return related_topics
-
-        for element in element_health_topic.findall("related-topic"):
-            related_topics.append(self.parse_related_topic(element=element))
-
-        return related_topics
+        return [
+            self.parse_related_topic(element=element) for element in elements
+        ]
 
     def parse_see_reference(self, element: etree.Element) -> Dict:
         """ Parses an element of type `see-reference` and returns the values of
@@ -494,33 +600,26 @@ class ParserXmlMedlineHealthTopic(ParserXmlBase):
         if element is None:
             return {}
 
-        see_reference = {"name": self._et(element=element)}
+        see_reference = {"name": _et(element=element)}
 
         return see_reference
 
     def parse_see_references(
-        self, element_health_topic: etree.Element
+        self, elements: List[etree.Element]
     ) -> List[Optional[Dict]]:
-        """ Extracts and parses `<see-reference>` elements from a
-            `<health-topic>` element and returns the values of the contained
-            elements.
+        """ Parses `<see-reference>` elements, extracted from a `<health-topic>`
+            element, and returns the values of the contained elements.
 
         Args:
-            element_health_topic (etree.Element): The `<health-topic>` element.
+            elements (List[etree.Element]): The `<see-reference>` elements.
 
         Returns:
             List[Optional[Dict]]: The parsed values of the contained elements.
         """
 
-        see_references = []
-
-        if element_health_topic is None:
-            return see_references
-
-        for element in element_health_topic.findall("see-reference"):
-            see_references.append(self.parse_see_reference(element=element))
-
-        return see_references
+        return [
+            self.parse_see_reference(element=element) for element in elements
+        ]
 
     def parse_health_topic(self, element: etree.Element) -> Dict:
         """ Parses an element of type `health-topic` and returns the values of
@@ -536,36 +635,43 @@ class ParserXmlMedlineHealthTopic(ParserXmlBase):
         if element is None:
             return {}
 
+        # Bind the attribute getter once as it's used for every attribute.
+        get = element.get
+
         # Skip Spanish entities.
-        if self._eav(element=element, attribute="language") == "Spanish":
+        if get("language") == "Spanish":
             return {}
 
+        # Group the children of the `<health-topic>` element by tag so that
+        # they're only traversed once.
+        children = self._collect_children(element=element)
+
         health_topic = {
-            "meta-desc": self._eav(element=element, attribute="meta-desc"),
-            "title": self._eav(element=element, attribute="title"),
-            "url": self._eav(element=element, attribute="url"),
-            "id": int(self._eav(element=element, attribute="id")),
-            "date-created": datetime.datetime.strptime(
-                self._eav(element=element, attribute="date-created"), "%m/%d/%Y"
-            ).date(),
+            "meta-desc": get("meta-desc") or None,
+            "title": get("title") or None,
+            "url": get("url") or None,
+            "id": int(get("id")),
+            "date-created": _parse_mdy(get("date-created")),
             "also-calleds": self.parse_also_calleds(
-                element_health_topic=element
+                elements=children.get(self.TAG_ALSO_CALLED, [])
+            ),
+            "full-summary": _et(children.get(self.TAG_FULL_SUMMARY, [None])[0]),
+            "groups": self.parse_groups(
+                elements=children.get(self.TAG_GROUP, [])
             ),
-            "full-summary": self._et(element.find("full-summary")),
-            "groups": self.parse_groups(element_health_topic=element),
             # Skipping `<language-mapped-topic>` elements.
             "mesh-headings": self.parse_mesh_headings(
-                element_health_topic=element
+                elements=children.get(self.TAG_MESH_HEADING, [])
             ),
             # Skipping `<other-language>` elements.
             "primary-institute": self.parse_primary_institute(
-                element=element.find("primary-institute")
+                element=children.get(self.TAG_PRIMARY_INSTITUTE, [None])[0]
             ),
             "related-topics": self.parse_related_topics(
-                element_health_topic=element
+                elements=children.get(self.TAG_RELATED_TOPIC, [])
             ),
             "see-references": self.parse_see_references(
-                element_health_topic=element
+                elements=children.get(self.TAG_SEE_REFERENCE, [])
             )
             # Skipping `<site>` elements.
         }
@@ -594,18 +700,27 @@ class ParserXmlMedlineHealthTopic(ParserXmlBase):
         file_xml = self.open_xml_file(filename_xml=filename_xml)
 
         # Retrieve an iterable that yields `<health-topic>` XML elements from
-        # the XML file.
+        # the XML file skipping Spanish entities before they're parsed.
         elements = self.generate_xml_elements(
-            file_xml=file_xml, element_tag="health-topic"
+            file_xml=file_xml,
+            element_tag=self.TAG_HEALTH_TOPIC,
+            predicate=_is_not_spanish,
         )
 
-        # Iterate over the `<health-topic>` elements and yield dictionaries with
-        # the parsed data.
-        for element in elements:
-            health_topic = self.parse_health_topic(element)
-
-            # Guard against empty documents.
-            if not health_topic:
-                continue
+        # Bind the element parser once instead of looking it up per element.
+        parse_health_topic = self.parse_health_topic
 
-            yield health_topic
+        # Iterate over the `<health-topic>` elements and yield dictionaries with
+        # the parsed data. The file is closed once the elements are exhausted
+        # or the generator is abandoned.
+        try:
+            for element in elements:
+                health_topic = parse_health_topic(element)
+
+                # Guard against empty documents.
+                if not health_topic:
+                    continue
+
+                yield health_topic
+        finally:
+            file_xml.close()
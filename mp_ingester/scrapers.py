@@ -1,8 +1,25 @@
-import io
+import asyncio
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+from lxml import etree
 from lxml import html as lxml_html
-from typing import List, Dict, Union
-
-import requests_async as requests
+from typing import (
+    List,
+    Dict,
+    Union,
+    Optional,
+    AsyncIterator,
+    BinaryIO,
+    Tuple,
+    Callable,
+    Awaitable,
+    Any,
+)
+
+import aiohttp
 
 from mp_ingester.loggers import create_logger
 from mp_ingester.excs import MedlinePlusHttpRequestGetError
@@ -11,6 +28,89 @@ from mp_ingester.excs import MedlinePlusHttpRequestGetError
 TypeHealthTopicGroupClasses = List[Dict[str, Union[str, List[Dict[str, str]]]]]
 TypeHealthTopicBodyParts = List[Dict[str, Union[str, List[Dict[str, str]]]]]
 
+# Size, in bytes, of the chunks HTTP response bodies are streamed in.
+CHUNK_SIZE = 65536
+
+# XPath expressions used by the scrapers compiled once at import.
+_XPATH_SECTIONS = etree.XPath(
+    "//article//div[contains(@class, 'col-')]//div[@class='section']"
+)
+_XPATH_SECTION_TITLE = etree.XPath(
+    "div[@class='section-header']/div[@class='section-title']//h2/text()"
+)
+_XPATH_SECTION_GROUPS = etree.XPath("div[@class='section-body']/ul/li/a")
+_XPATH_BODY_PARTS = etree.XPath("//div[@class='tp_rdbox_bborder']/div/ul/li/a")
+_XPATH_BODY_PART_HEALTH_TOPICS = etree.XPath(
+    "div[@class='tp_rdbox_bborder']/div/div/ul/li/a"
+)
+_XPATH_FILE_LINK = etree.XPath("a[contains(text(), $text)][1]")
+
+
+class _ContentBuffered:
+    """ Stand-in for the content stream of an HTTP response whose content has
+        already been read in its entirety.
+    """
+
+    def __init__(self, content: bytes):
+        self._content = content
+
+    async def read(self) -> bytes:
+        return self._content
+
+    async def iter_chunked(self, n: int) -> AsyncIterator[bytes]:
+        for start in range(0, len(self._content), n):
+            yield self._content[start : start + n]
+
+
+class _ResponseBuffered:
+    """ Stand-in for an `aiohttp.ClientResponse` whose content has already
+        been read, e.g., from the page cache, so that it can be passed to the
+        same readers as live responses.
+    """
+
+    status = 200
+
+    def __init__(self, content: bytes):
+        self.content = _ContentBuffered(content)
+
+    async def read(self) -> bytes:
+        return await self.content.read()
+
+
+class _ContentTeed:
+    """ Wrapper around the content stream of an HTTP response that writes the
+        content to a file as it's being read.
+    """
+
+    def __init__(self, content: aiohttp.StreamReader, file: BinaryIO):
+        self._content = content
+        self._file = file
+
+    async def read(self) -> bytes:
+        content = await self._content.read()
+        self._file.write(content)
+        return content
+
+    async def iter_chunked(self, n: int) -> AsyncIterator[bytes]:
+        async for chunk in self._content.iter_chunked(n):
+            self._file.write(chunk)
+            yield chunk
+
+
+class _ResponseTeed:
+    """ Wrapper around an `aiohttp.ClientResponse` that writes the response
+        content to a file as it's being read so that it can be cached without
+        being held in memory as a whole.
+    """
+
+    def __init__(self, response: aiohttp.ClientResponse, file: BinaryIO):
+        self.status = response.status
+        self.headers = response.headers
+        self.content = _ContentTeed(response.content, file)
+
+    async def read(self) -> bytes:
+        return await self.content.read()
+
 
 class ScraperBase:
     """ Scraper base-class."""
@@ -25,33 +125,402 @@ class ScraperBase:
 
 
 class ScraperMedlineBase(ScraperBase):
-    """ MedlinePlus scraper base-class."""
+    """ MedlinePlus scraper base-class.
+
+    When used as an asynchronous context-manager the scraper keeps a single
+    HTTP session open which is shared by all requests made within the context
+    so that pooled connections to MedlinePlus are reused.
+    """
+
+    # Number of times a request that failed due to a connection error, a
+    # timeout, or a server error is retried and the factor, in seconds, of the
+    # exponential back-off between retries.
+    MAX_RETRIES = 3
+    BACKOFF_FACTOR = 0.3
+
+    def __init__(self, **kwargs):
+        """ Constructor and initialization."""
+
+        super().__init__(**kwargs)
+
+        self._session = None  # type: Optional[aiohttp.ClientSession]
+
+        # Directory under which fetched pages are cached along with their
+        # `ETag` and `Last-Modified` validators so that pages are only
+        # re-downloaded when they've changed. Caching is disabled if `None`.
+        self.cache_dir = kwargs.get("cache_dir")  # type: Optional[str]
+
+        # Idle HTML feed parsers reused across fetches. Each concurrent fetch
+        # takes a parser of its own as feeding is stateful.
+        self._parsers = []  # type: List[lxml_html.HTMLParser]
+
+    @staticmethod
+    def _create_session() -> aiohttp.ClientSession:
+        """ Creates an HTTP session with a pooled connector and timeouts.
+
+        Returns:
+            aiohttp.ClientSession: The created HTTP session.
+        """
 
-    async def fetch_page(self, url: str) -> requests.Response:
-        """ Fetches a given URL and returns the response.
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=32, limit_per_host=16, ttl_dns_cache=300
+            ),
+            timeout=aiohttp.ClientTimeout(
+                total=60, sock_connect=5, sock_read=30
+            ),
+        )
+
+    async def close(self) -> None:
+        """ Closes the HTTP session shared by the scraper releasing its pooled
+            connections.
+        """
+
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "ScraperMedlineBase":
+        if self._session is None:
+            self._session = self._create_session()
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    @contextlib.asynccontextmanager
+    async def _session_scope(
+        self, session: Optional[aiohttp.ClientSession] = None
+    ) -> AsyncIterator[aiohttp.ClientSession]:
+        """ Yields the HTTP session to perform requests with falling back to a
+            session of its own, closed when the context is exited, if the
+            scraper isn't being used as a context-manager.
+
+        Args:
+            session (Optional[aiohttp.ClientSession]): The HTTP session to
+                yield. Defaults to `None` in which case the session shared by
+                the scraper is yielded or, if there's none, a new session.
+
+        Yields:
+            aiohttp.ClientSession: The HTTP session to perform requests with.
+        """
+
+        if session is None:
+            session = self._session
+
+        if session is not None:
+            yield session
+            return
+
+        async with self._create_session() as session:
+            yield session
+
+    async def _fetch(
+        self,
+        url: str,
+        read: Callable[[aiohttp.ClientResponse], Awaitable[Any]],
+        session: Optional[aiohttp.ClientSession] = None,
+        timeout: Optional[aiohttp.ClientTimeout] = None,
+        use_cache: bool = True,
+    ) -> Any:
+        """ Fetches a given URL retrying failed requests and returns the
+            response content as read by a given coroutine function.
+
+        When caching, the response content is written to the cache as it's
+        being read by `read` while any content left unread by `read` is
+        written after it returns so that the cached page is complete. A
+        `304 Not Modified` response to the conditional request is served from
+        the cache.
 
         Args:
             url (str): The URL to fetch.
+            read (Callable[[aiohttp.ClientResponse], Awaitable[Any]]): The
+                coroutine function reading the content of a successful
+                response.
+            session (Optional[aiohttp.ClientSession]): The HTTP session to
+                fetch the URL with. Defaults to `None` in which case the
+                session shared by the scraper is used or, if there's none, a
+                new session is created for this request.
+            timeout (Optional[aiohttp.ClientTimeout]): The timeouts of the
+                request. Defaults to `None` in which case the timeouts of the
+                session are used.
+            use_cache (bool, optional): Whether to cache the response content
+                under `cache_dir`, if defined, and revalidate it with a
+                conditional request on subsequent fetches. Defaults to `True`.
 
         Returns:
-            requests.Response: The response retrieved when fetching the given
-                url.
+            Any: The response content as read by `read`.
+
+        Raises:
+            MedlinePlusHttpRequestGetError: Raised when the URL couldn't be
+                retrieved after retrying.
         """
 
+        if session is None:
+            async with self._session_scope() as session:
+                return await self._fetch(
+                    url=url,
+                    read=read,
+                    session=session,
+                    timeout=timeout,
+                    use_cache=use_cache,
+                )
+
         self.logger.info(f"Retrieving HTML content under URL {url}.")
 
-        response = await requests.get(url=url)
+        # Only ask for previously cached pages if they've changed since.
+        filename_cache = None  # type: Optional[str]
+        validators, content_cached = {}, None
+        if use_cache and self.cache_dir is not None:
+            filename_cache = os.path.join(
+                self.cache_dir, hashlib.sha1(url.encode("utf-8")).hexdigest()
+            )
+            validators, content_cached = self._load_cached_page(filename_cache)
+
+        headers = {}
+        if "etag" in validators:
+            headers["If-None-Match"] = validators["etag"]
+        if "last_modified" in validators:
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+        # The session's timeouts are only overridden if explicitly requested as
+        # a `timeout` of `None` would disable them altogether.
+        kwargs_request = {"headers": headers}  # type: Dict[str, Any]
+        if timeout is not None:
+            kwargs_request["timeout"] = timeout
+
+        for attempt in range(self.MAX_RETRIES + 1):
+            # Back off exponentially before retrying a failed request.
+            if attempt:
+                await asyncio.sleep(self.BACKOFF_FACTOR * 2 ** (attempt - 1))
+
+            try:
+                async with session.get(url, **kwargs_request) as response:
+                    status = response.status
+                    if status < 400 and filename_cache is None:
+                        return await read(response)
+                    elif status == 304 and content_cached is not None:
+                        self.logger.info(
+                            f"Using cached HTML content of URL {url}."
+                        )
+                        return await read(_ResponseBuffered(content_cached))
+                    elif status < 400:
+                        return await self._read_cached(
+                            response=response,
+                            read=read,
+                            filename_cache=filename_cache,
+                        )
+                    content = await response.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                msg = (
+                    f"Could not retrieve HTML content under URL {url} due to "
+                    f"'{exc!r}'."
+                )
+                self.logger.warning(msg)
+                continue
+
+            # Server errors are retried while client errors are not.
+            if status >= 500:
+                msg = (
+                    f"Could not retrieve HTML content under URL {url}. A "
+                    f"response with status code of {status} was received."
+                )
+                self.logger.warning(msg)
+                continue
 
-        if not response.ok:
             msg = (
-                f"Could not retrieve HTML content under URL {url}. A response "
-                f"with status code of {response.status_code} and content of "
-                f"'{response.content}' was received."
+                f"Could not retrieve HTML content under URL {url}. A "
+                f"response with status code of {status} and "
+                f"content of '{content}' was received."
             )
             self.logger.error(msg)
             raise (MedlinePlusHttpRequestGetError(msg))
 
-        return response
+        self.logger.error(msg)
+        raise (MedlinePlusHttpRequestGetError(msg))
+
+    @staticmethod
+    def _load_cached_page(
+        filename_cache: str,
+    ) -> Tuple[Dict[str, str], Optional[bytes]]:
+        """ Loads a cached page and its validators.
+
+        Args:
+            filename_cache (str): The path, without extension, of the cached
+                page.
+
+        Returns:
+            Tuple[Dict[str, str], Optional[bytes]]: The `ETag` and
+                `Last-Modified` validators of the cached page and its content
+                or an empty `dict` and `None` if the page isn't cached.
+        """
+
+        try:
+            with open(filename_cache + ".json") as file_validators:
+                validators = json.load(file_validators)
+            with open(filename_cache + ".html", "rb") as file_content:
+                content = file_content.read()
+        except (OSError, ValueError):
+            return {}, None
+
+        return validators, content
+
+    async def _read_cached(
+        self,
+        response: aiohttp.ClientResponse,
+        read: Callable[[aiohttp.ClientResponse], Awaitable[Any]],
+        filename_cache: str,
+    ) -> Any:
+        """ Reads the content of a successful response with a given coroutine
+            function while caching it along with its validators. Pages without
+            any validators are not cached as they can't be revalidated.
+
+        The content is written to a temporary file as it's being read which
+        then replaces the cached page so that interrupted reads never leave
+        truncated pages. The content is written before the validators so that
+        validators are never stored without the content they refer to.
+
+        Args:
+            response (aiohttp.ClientResponse): The response to read.
+            read (Callable[[aiohttp.ClientResponse], Awaitable[Any]]): The
+                coroutine function reading the content of the response.
+            filename_cache (str): The path, without extension, of the cached
+                page.
+
+        Returns:
+            Any: The response content as read by `read`.
+        """
+
+        validators = {
+            key: value
+            for key, value in (
+                ("etag", response.headers.get("ETag")),
+                ("last_modified", response.headers.get("Last-Modified")),
+            )
+            if value is not None
+        }
+        if not validators:
+            return await read(response)
+
+        os.makedirs(os.path.dirname(filename_cache), exist_ok=True)
+
+        # Concurrent fetches of the same URL each write their own temporary
+        # file.
+        fd, filename_tmp = tempfile.mkstemp(
+            suffix=".tmp", dir=os.path.dirname(filename_cache)
+        )
+        try:
+            with os.fdopen(fd, "wb") as file_content:
+                result = await read(_ResponseTeed(response, file_content))
+                # Write any content `read` didn't need, e.g., after finding
+                # what it was looking for early in the page.
+                async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                    file_content.write(chunk)
+            os.replace(filename_tmp, filename_cache + ".html")
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(filename_tmp)
+            raise
+
+        filename_tmp = f"{filename_cache}.{os.getpid()}.tmp"
+        with open(filename_tmp, "w") as file_validators:
+            json.dump(validators, file_validators)
+        os.replace(filename_tmp, filename_cache + ".json")
+
+        return result
+
+    async def fetch_tree(
+        self, url: str, session: Optional[aiohttp.ClientSession] = None
+    ) -> lxml_html.HtmlElement:
+        """ Fetches a given URL and parses the response content as HTML while
+            it's being streamed so that parsing overlaps the download and the
+            content is never held in memory as a whole.
+
+        Args:
+            url (str): The URL to fetch.
+            session (Optional[aiohttp.ClientSession]): The HTTP session to
+                fetch the URL with. Defaults to `None` in which case the
+                session shared by the scraper is used or, if there's none, a
+                new session is created for this request.
+
+        Returns:
+            lxml_html.HtmlElement: The root element of the parsed HTML.
+
+        Raises:
+            MedlinePlusHttpRequestGetError: Raised when the URL couldn't be
+                retrieved after retrying.
+        """
+
+        async def read(response: aiohttp.ClientResponse):
+            if self._parsers:
+                parser = self._parsers.pop()
+            else:
+                parser = lxml_html.HTMLParser(
+                    encoding="utf-8",
+                    collect_ids=False,
+                    no_network=True,
+                    remove_blank_text=True,
+                )
+
+            try:
+                async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                    parser.feed(chunk)
+                doc = parser.close()
+            except BaseException:
+                # Reset the parser's state before releasing it.
+                try:
+                    parser.close()
+                except etree.LxmlError:
+                    pass
+                raise
+            finally:
+                self._parsers.append(parser)
+
+            return doc
+
+        return await self._fetch(url=url, read=read, session=session)
+
+    async def download_file(
+        self, url: str, filename_output: str, chunk_size: int = 65536
+    ) -> str:
+        """ Downloads a given URL to a file streaming the response content in
+            chunks so that the file is never held in memory in its entirety.
+
+        Failed downloads are retried as per `_fetch`.
+
+        Args:
+            url (str): The URL to download.
+            filename_output (str): The path to the file the response content
+                will be written to.
+            chunk_size (int, optional): The size of the chunks, in bytes, the
+                response content is streamed in. Defaults to `65536`.
+
+        Returns:
+            str: The path to the downloaded file.
+        """
+
+        self.logger.info(f"Downloading URL {url} to '{filename_output}'.")
+
+        async def read(response: aiohttp.ClientResponse) -> str:
+            # The file is rewritten from scratch on every attempt.
+            with open(filename_output, "wb") as file_output:
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    file_output.write(chunk)
+
+            return filename_output
+
+        # Downloads aren't bound by a total timeout as the XML files can take
+        # longer than the session's to download while stalled connections are
+        # still caught by the read timeout.
+        return await self._fetch(
+            url=url,
+            read=read,
+            timeout=aiohttp.ClientTimeout(
+                total=None, sock_connect=5, sock_read=30
+            ),
+            use_cache=False,
+        )
 
 
 class ScraperHealthTopicGroupClasses(ScraperMedlineBase):
@@ -75,27 +544,18 @@ class ScraperHealthTopicGroupClasses(ScraperMedlineBase):
 
         results = []
 
-        response = await self.fetch_page(url=medline_health_topics_url)
-
-        # Parse the HTML source with the XML parser.
-        doc = lxml_html.parse(io.StringIO(response.content.decode("utf-8")))
+        # Retrieve and parse the HTML source.
+        doc = await self.fetch_tree(url=medline_health_topics_url)
 
         # Retrieve the different XML elements with a CSS class of `section`.
-        elements_sections = doc.xpath(
-            "//article//div[contains(@class, 'col-')]//div[@class='section']"
-        )
+        elements_sections = _XPATH_SECTIONS(doc)
 
         for elements_section in elements_sections:
             # Retrieve the name of the health-topic group class.
-            health_topic_class_name = elements_section.xpath(
-                "div[@class='section-header']/div[@class='section-title']"
-                "//h2/text()"
-            )[0]
+            health_topic_class_name = _XPATH_SECTION_TITLE(elements_section)[0]
 
             # Retrieve the health-topic group links under each group class.
-            elements_groups = elements_section.xpath(
-                "div[@class='section-body']/ul/li/a"
-            )
+            elements_groups = _XPATH_SECTION_GROUPS(elements_section)
 
             results.append(
                 {
@@ -119,7 +579,9 @@ class ScraperHealthTopicGroupBodyParts(ScraperMedlineBase):
     """
 
     async def scrape(
-        self, medline_health_topic_group_url: str
+        self,
+        medline_health_topic_group_url: str,
+        session: Optional[aiohttp.ClientSession] = None,
     ) -> TypeHealthTopicBodyParts:
         """ Scrapes the MedlinePlus health topics page and retrieves the
             MedlinePlus health-topic groups categorized by their assigned class.
@@ -127,22 +589,99 @@ class ScraperHealthTopicGroupBodyParts(ScraperMedlineBase):
         Args:
             medline_health_topic_group_url (str): The URL of the MedlinePlus
                 health topics.
+            session (Optional[aiohttp.ClientSession]): The HTTP session to
+                fetch the page with. Defaults to `None` in which case the
+                session shared by the scraper is used or, if there's none, a
+                new session is created for this request.
 
         Returns:
             TypeHealthTopicBodyParts: The scraped data.
         """
 
+        # Retrieve and parse the HTML source.
+        doc = await self.fetch_tree(
+            url=medline_health_topic_group_url, session=session
+        )
+
+        return self.parse(
+            doc=doc,
+            medline_health_topic_group_url=medline_health_topic_group_url,
+        )
+
+    async def scrape_many(
+        self, medline_health_topic_group_urls: List[str], concurrency: int = 16
+    ) -> TypeHealthTopicBodyParts:
+        """ Scrapes multiple MedlinePlus health-topic group pages concurrently
+            over the HTTP session shared by the scraper and retrieves the
+            body-parts and health-topics under them.
+
+        Each page is parsed while it's being retrieved so that only the pages
+        of the requests in flight are held in memory.
+
+        Args:
+            medline_health_topic_group_urls (List[str]): The URLs of the
+                MedlinePlus health-topic group pages.
+            concurrency (int, optional): The maximum number of requests in
+                flight at any given time. Defaults to `16`.
+
+        Returns:
+            TypeHealthTopicBodyParts: The scraped data of all pages in order of
+                retrieval.
+        """
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def scrape_bounded(
+            url: str, session: aiohttp.ClientSession
+        ) -> TypeHealthTopicBodyParts:
+            async with semaphore:
+                return await self.scrape(
+                    medline_health_topic_group_url=url, session=session
+                )
+
         results = []
 
-        response = await self.fetch_page(url=medline_health_topic_group_url)
+        # Share a single session across all pages.
+        async with self._session_scope() as session:
+            for future in asyncio.as_completed(
+                [
+                    scrape_bounded(url=url, session=session)
+                    for url in medline_health_topic_group_urls
+                ]
+            ):
+                results.extend(await future)
 
-        # Parse the HTML source with the XML parser.
-        doc = lxml_html.parse(io.StringIO(response.content.decode("utf-8")))
+        return results
+
+    @staticmethod
+    def parse(
+        doc: lxml_html.HtmlElement, medline_health_topic_group_url: str
+    ) -> TypeHealthTopicBodyParts:
+        """ Parses the HTML of a MedlinePlus health-topic group page and
+            retrieves the body parts and health-topics under them.
+
+        Args:
+            doc (lxml_html.HtmlElement): The root element of the parsed HTML of
+                the health-topic group page.
+            medline_health_topic_group_url (str): The URL of the health-topic
+                group page.
+
+        Returns:
+            TypeHealthTopicBodyParts: The scraped data.
+        """
+
+        results = []
 
         # Retrieve the body-part elements.
-        elements_body_parts = doc.xpath(
-            "//div[@class='tp_rdbox_bborder']/div/ul/li/a"
-        )
+        elements_body_parts = _XPATH_BODY_PARTS(doc)
+
+        # Index the `div` elements by ID once so that each body-part's
+        # container is looked up without a document-wide search.
+        divs_by_id = {}  # type: Dict[str, lxml_html.HtmlElement]
+        for element_div in doc.iter("div"):
+            div_id = element_div.get("id")
+            if div_id:
+                divs_by_id.setdefault(div_id, element_div)
 
         for element_body_part in elements_body_parts:
             # Retrieve the body part ID for this element.
@@ -151,10 +690,11 @@ class ScraperHealthTopicGroupBodyParts(ScraperMedlineBase):
             )
 
             # Retrieve the links to health-topics under the given body-part.
-            elements_health_topics = doc.xpath(
-                f"//div[@id='{element_body_part_id}']"
-                f"/div[@class='tp_rdbox_bborder']"
-                f"/div/div/ul/li/a"
+            element_container = divs_by_id.get(element_body_part_id)
+            elements_health_topics = (
+                _XPATH_BODY_PART_HEALTH_TOPICS(element_container)
+                if element_container is not None
+                else []
             )
 
             results.append(
@@ -179,6 +719,74 @@ class ScraperMedlineFiles(ScraperMedlineBase):
         to the latest XML files.
     """
 
+    # Texts of the links to the latest XML files keyed on the name under which
+    # each link is returned.
+    LINK_TEXTS = {
+        "health_topic_xml": "MedlinePlus Health Topic XML",
+        "health_topic_compressed_xml": (
+            "MedlinePlus Compressed Health Topic XML"
+        ),
+        "health_topic_group_xml": "MedlinePlus Health Topic Group XML",
+    }
+
+    @classmethod
+    def parse_links(cls, element_section: etree.Element) -> Dict[str, str]:
+        """ Retrieves the links to the XML files under a `p` section of the
+            MedlinePlus XML Files page.
+
+        Args:
+            element_section (etree.Element): The `p` element containing the
+                XML file links.
+
+        Returns:
+            Dict[str, str]: The links to the XML files.
+        """
+
+        return {
+            key: _XPATH_FILE_LINK(element_section, text=text)[0].attrib["href"]
+            for key, text in cls.LINK_TEXTS.items()
+        }
+
+    async def read_links(
+        self, response: aiohttp.ClientResponse
+    ) -> Optional[Dict[str, str]]:
+        """ Parses the MedlinePlus XML Files page while it's being streamed and
+            retrieves the links to the latest XML files as soon as they've
+            been read abandoning the rest of the page. When caching, the rest
+            of the page is still downloaded into the cache but isn't parsed.
+
+        Args:
+            response (aiohttp.ClientResponse): The response of the MedlinePlus
+                XML Files page.
+
+        Returns:
+            Optional[Dict[str, str]]: The links to the latest XML files or
+                `None` if they couldn't be found.
+        """
+
+        parser = etree.HTMLPullParser(
+            events=("end",), tag=("h3", "p"), encoding="utf-8"
+        )
+
+        # The parent of the first `h3` heading preceding the latest files.
+        element_parent = None
+        async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+            parser.feed(chunk)
+            for _, element in parser.read_events():
+                if element_parent is None:
+                    if element.tag == "h3" and "Files generated on" in (
+                        element.text or ""
+                    ):
+                        element_parent = element.getparent()
+                # The first `p` sibling following the heading contains the
+                # links to the latest files.
+                elif (
+                    element.tag == "p" and element.getparent() is element_parent
+                ):
+                    return self.parse_links(element_section=element)
+
+        return None
+
     async def scrape(self, medline_xml_files_url: str) -> Dict[str, str]:
         """ Scrapes the MedlinePlus XML Files page and retrieve the links to the
             latest XML files.
@@ -189,36 +797,22 @@ class ScraperMedlineFiles(ScraperMedlineBase):
 
         Returns:
             Dict[str, str]: The scraped data.
-        """
-
-        response = await self.fetch_page(url=medline_xml_files_url)
 
-        # Parse the HTML source with the XML parser.
-        doc = lxml_html.parse(io.StringIO(response.content.decode("utf-8")))
-
-        # Retrieve the first `p` section containing the XML file links which
-        # should be the links to the latest files.
-        elements_latest_section = doc.xpath(
-            "//h3[contains(text(),'Files generated on')][1]"
-            "/following-sibling::p[1]"
-        )[0]
-
-        element_topics = elements_latest_section.xpath(
-            "a[contains(text(), 'MedlinePlus Health Topic XML')][1]"
-        )[0]
-
-        element_topics_zip = elements_latest_section.xpath(
-            "a[contains(text(), 'MedlinePlus Compressed Health Topic XML')][1]"
-        )[0]
+        Raises:
+            ValueError: Raised when the links to the latest XML files couldn't
+                be found.
+        """
 
-        element_groups = elements_latest_section.xpath(
-            "a[contains(text(), 'MedlinePlus Health Topic Group XML')][1]"
-        )[0]
+        result = await self._fetch(
+            url=medline_xml_files_url, read=self.read_links
+        )
 
-        result = {
-            "health_topic_xml": element_topics.attrib["href"],
-            "health_topic_compressed_xml": element_topics_zip.attrib["href"],
-            "health_topic_group_xml": element_groups.attrib["href"],
-        }
+        if result is None:
+            msg = (
+                f"Could not find the links to the latest XML files under URL "
+                f"{medline_xml_files_url}."
+            )
+            self.logger.error(msg)
+            raise ValueError(msg)
 
         return result
@@ -1,18 +1,18 @@
 # -*- coding: utf-8 -*-
 
+import types
+
 import sentry_sdk
 from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
 
-import attrdict
-
 
-def initialize_sentry(cfg: attrdict.AttrDict) -> None:
+def initialize_sentry(cfg: types.SimpleNamespace) -> None:
     """ Initializes the Sentry agent to capture exceptions which are then
         displayed under the sentry.io dashboard and the `mp-ingester`
         project.
 
     Args:
-        cfg (attrdict.AttrDict): The service configuration dictionary.
+        cfg (types.SimpleNamespace): The service configuration namespace.
     """
 
     # Initialization is skipped if the Sentry configuration has not been
@@ -1,6 +1,15 @@
 # -*- coding: utf-8 -*-
 
-from typing import Callable
+import functools
+import inspect
+import itertools
+import json
+import logging
+import os
+import time
+from typing import Callable, Iterable, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
 
 
 def log_ingestion_of_document(document_name: str) -> Callable:
@@ -14,12 +23,15 @@ def log_ingestion_of_document(document_name: str) -> Callable:
     # Define the actual decorator. This three-tier decorator functions are
     # necessary when defining decorator functions with arguments.
     def log_ingestion_of_document_decorator(func):
-        # Define the wrapper function.
+        # Define the wrapper function retaining the name and docstring of the
+        # decorated method.
+        @functools.wraps(func)
         def wrapper(self, *args, **kwargs):
 
-            msg = "Ingesting '{}' document"
-            msg_fmt = msg.format(document_name)
-            self.logger.debug(msg_fmt)
+            # Skip the logging call altogether unless debug messages are
+            # actually emitted and defer the formatting to the handlers.
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Ingesting '%s' document", document_name)
 
             # Simply execute the decorated method with the provided arguments
             # and return the result.
@@ -28,3 +40,102 @@ def log_ingestion_of_document(document_name: str) -> Callable:
         return wrapper
 
     return log_ingestion_of_document_decorator
+
+
+def cache_to_json_file(
+    filename_cache: str,
+    ttl: int = 86400,
+    key_args: Optional[Iterable[str]] = None,
+) -> Callable:
+    """ Decorator that caches the JSON-serializable result of a coroutine
+        function in a file and reuses it for as long as the file is younger
+        than a given time-to-live.
+
+    The cached result is keyed on the arguments of the decorated coroutine
+    function so that it's only reused for calls with the same arguments, and
+    empty results, e.g., of a failed scrape, are never cached.
+
+    Args:
+        filename_cache (str): The path to the JSON file the result is cached
+            in.
+        ttl (int, optional): The time-to-live of the cached result in seconds.
+            Defaults to `86400`, i.e., 24 hours.
+        key_args (Optional[Iterable[str]]): The names of the JSON-serializable
+            arguments the cached result is keyed on. Defaults to `None` in
+            which case all arguments are used.
+    """
+
+    # Define the actual decorator. This three-tier decorator functions are
+    # necessary when defining decorator functions with arguments.
+    def cache_to_json_file_decorator(func):
+        signature = inspect.signature(func)
+
+        # Define the wrapper coroutine function.
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+
+            # Retrieve the values of the arguments the cache is keyed on. These
+            # are passed through JSON so they compare equal to the cached ones.
+            arguments = signature.bind(*args, **kwargs)
+            arguments.apply_defaults()
+            key = json.loads(
+                json.dumps(
+                    {
+                        name: value
+                        for name, value in arguments.arguments.items()
+                        if key_args is None or name in key_args
+                    }
+                )
+            )
+
+            # Return the cached result if it's still fresh and was cached for
+            # the same arguments.
+            if (
+                os.path.isfile(filename_cache)
+                and time.time() - os.path.getmtime(filename_cache) < ttl
+            ):
+                with open(filename_cache) as file_cache:
+                    cache = json.load(file_cache)
+                if isinstance(cache, dict) and cache.get("key") == key:
+                    return cache["result"]
+
+            result = await func(*args, **kwargs)
+
+            # Empty results are not cached as they're likely the product of a
+            # failure.
+            if not result:
+                return result
+
+            # Write the cache to a temporary file which then replaces the cache
+            # so that an interrupted write never leaves a truncated cache.
+            filename_cache_tmp = f"{filename_cache}.{os.getpid()}.tmp"
+            with open(filename_cache_tmp, "w") as file_cache:
+                json.dump({"key": key, "result": result}, file_cache)
+            os.replace(filename_cache_tmp, filename_cache)
+
+            return result
+
+        return wrapper
+
+    return cache_to_json_file_decorator
+
+
+def generate_batches(items: Iterable[T], batch_size: int) -> Iterator[List[T]]:
+    """ Splits an iterable into lists of a given maximum size without
+        materializing the entire iterable.
+
+    Args:
+        items (Iterable[T]): The iterable to split.
+        batch_size (int): The maximum number of items per batch.
+
+    Returns:
+        Iterator[List[T]]: An iterator yielding the batches.
+    """
+
+    iterator = iter(items)
+    while True:
+        batch = list(itertools.islice(iterator, batch_size))
+        if not batch:
+            return
+
+        yield batch
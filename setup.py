@@ -11,9 +11,24 @@ with open('README.md') as readme_file:
 with open('CHANGELOG.md') as history_file:
     history = history_file.read()
 
+# The `fform` ORM/DAL package is not on PyPI and is installed from its
+# repository as per `requirements.txt`.
 requirements = [
+    'aiohttp>=3.6.2',
+    'colorlog>=4.0.2',
+    'lxml>=4.4.1',
+    'psycopg2>=2.8.3',
+    'sentry-sdk>=0.11.1',
+    'SQLAlchemy>=1.3.8,<1.4',
+    'ujson>=1.35',
+    'validictory>=1.1.2',
 ]
 
+# Optional faster gzip backends used by the parsers when installed.
+extras_requirements = {
+    'gzip': ['rapidgzip', 'indexed_gzip'],
+}
+
 setup_requirements = [
     'pytest-runner',
 ]
@@ -33,19 +48,17 @@ setup(
     packages=find_packages(include=['mp_ingester']),
     include_package_data=True,
     install_requires=requirements,
+    extras_require=extras_requirements,
+    python_requires='>=3.8',
     zip_safe=False,
     keywords='mp_ingester',
     classifiers=[
         'Development Status :: 2 - Pre-Alpha',
         'Intended Audience :: Developers',
         'Natural Language :: English',
-        "Programming Language :: Python :: 2",
-        'Programming Language :: Python :: 2.6',
-        'Programming Language :: Python :: 2.7',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.3',
-        'Programming Language :: Python :: 3.4',
-        'Programming Language :: Python :: 3.5',
+        'Programming Language :: Python :: 3 :: Only',
+        'Programming Language :: Python :: 3.8',
     ],
     test_suite='tests',
     tests_require=test_requirements,
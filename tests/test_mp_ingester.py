@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for the `mp_ingester.mp_ingester` module."""
+
+import asyncio
+import itertools
+import unittest
+
+from mp_ingester import mp_ingester
+
+
+class TestIngestPipelined(unittest.TestCase):
+    """ Tests the `_ingest_pipelined` coroutine function."""
+
+    def setUp(self):
+        # The tasks left pending after running a coroutine through `_run`.
+        self.pending = []
+
+    def _run(self, coroutine):
+        """ Runs a coroutine and keeps track of the tasks left pending once it
+            has completed or failed.
+        """
+
+        async def run():
+            try:
+                await coroutine
+            finally:
+                tasks = asyncio.all_tasks() - {asyncio.current_task()}
+                self.pending = [task for task in tasks if not task.done()]
+
+        asyncio.run(run())
+
+    def test_ingest_pipelined(self):
+        """ Tests that all documents are ingested in batches."""
+
+        batches = []
+
+        self._run(
+            mp_ingester._ingest_pipelined(
+                documents=range(2 * mp_ingester.BATCH_SIZE + 1),
+                ingest=batches.append,
+            )
+        )
+
+        self.assertEqual(
+            [len(batch) for batch in batches],
+            [mp_ingester.BATCH_SIZE, mp_ingester.BATCH_SIZE, 1],
+        )
+        self.assertEqual(self.pending, [])
+
+    def test_ingest_pipelined_ingest_failure(self):
+        """ Tests that a failing ingestion re-raises its exception and cancels
+            the production of the batches leaving no task pending.
+        """
+
+        def ingest(batch):
+            raise KeyError("body-part")
+
+        with self.assertRaises(KeyError):
+            # The documents never run out so the production of the batches
+            # only stops if cancelled.
+            self._run(
+                mp_ingester._ingest_pipelined(
+                    documents=itertools.count(), ingest=ingest
+                )
+            )
+
+        self.assertEqual(self.pending, [])
+
+    def test_ingest_pipelined_produce_failure(self):
+        """ Tests that a failing production of the batches re-raises its
+            exception and cancels the ingestion leaving no task pending.
+        """
+
+        def generate_documents():
+            yield from range(mp_ingester.BATCH_SIZE)
+            raise ValueError("parsing")
+
+        with self.assertRaises(ValueError):
+            self._run(
+                mp_ingester._ingest_pipelined(
+                    documents=generate_documents(), ingest=lambda batch: None
+                )
+            )
+
+        self.assertEqual(self.pending, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for the `mp_ingester.utils` module."""
+
+import asyncio
+import os
+import tempfile
+import unittest
+
+from mp_ingester.utils import cache_to_json_file
+
+
+class TestCacheToJsonFile(unittest.TestCase):
+    """ Tests the `cache_to_json_file` decorator."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename_cache = os.path.join(self.directory.name, "cache.json")
+
+        # The arguments of the calls that weren't served from the cache.
+        self.calls = []
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _decorate(self, results):
+        """ Decorates a coroutine function returning the result for its URL
+            from a given `dict`.
+        """
+
+        @cache_to_json_file(
+            filename_cache=self.filename_cache, key_args=["url"]
+        )
+        async def scrape(scraper, url):
+            """ Scrapes a URL."""
+            self.calls.append(url)
+            return results[url]
+
+        return scrape
+
+    def test_cache_hit(self):
+        """ Tests that repeat calls with the same arguments are cached."""
+
+        scrape = self._decorate(results={"a": ["x"]})
+
+        self.assertEqual(asyncio.run(scrape(object(), "a")), ["x"])
+        self.assertEqual(asyncio.run(scrape(object(), url="a")), ["x"])
+        self.assertEqual(self.calls, ["a"])
+        self.assertEqual(scrape.__doc__, " Scrapes a URL.")
+
+    def test_cache_keyed_on_arguments(self):
+        """ Tests that the cached result isn't reused for other arguments."""
+
+        scrape = self._decorate(results={"a": ["x"], "b": ["y"]})
+
+        self.assertEqual(asyncio.run(scrape(object(), "a")), ["x"])
+        self.assertEqual(asyncio.run(scrape(object(), "b")), ["y"])
+        self.assertEqual(self.calls, ["a", "b"])
+
+    def test_empty_result_not_cached(self):
+        """ Tests that empty results are not cached."""
+
+        scrape = self._decorate(results={"a": []})
+
+        self.assertEqual(asyncio.run(scrape(object(), "a")), [])
+        self.assertEqual(asyncio.run(scrape(object(), "a")), [])
+        self.assertEqual(self.calls, ["a", "a"])
+        self.assertFalse(os.path.exists(self.filename_cache))
+
+
+if __name__ == "__main__":
+    unittest.main()